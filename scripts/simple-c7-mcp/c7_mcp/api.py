@@ -1,11 +1,19 @@
 """FastAPI application with health check endpoint."""
 
+import logging
+import math
+import os
 import re
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from c7_mcp.db import close_db, init_schema
@@ -14,8 +22,32 @@ from c7_mcp.exceptions import (
     ConflictError,
     DatabaseError,
     NotFoundError,
+    UnreadBodyError,
 )
+from c7_mcp.http_client import close_http_client
+from c7_mcp.metrics import RequestMetrics, render_cache_stats
+from c7_mcp.ratelimit import RateLimiter
 from c7_mcp.routers import documents, libraries, mcp
+from c7_mcp.services import document as document_service
+from c7_mcp.services import library as library_service
+from c7_mcp.services import mcp as mcp_service
+
+logger = logging.getLogger(__name__)
+
+# Size of the worker thread pool that runs blocking service calls
+# (anyio's default is 40).
+THREAD_POOL_SIZE = int(os.getenv("C7_THREAD_POOL_SIZE", "40"))
+
+# Per-client MCP request budget: sustained requests/second and burst size
+# (a rate of 0 disables limiting).
+MCP_RATE_LIMIT = float(os.getenv("C7_MCP_RATE_LIMIT", "30"))
+MCP_RATE_BURST = float(os.getenv("C7_MCP_RATE_BURST", "60"))
+# Header holding the client address set by a trusted reverse proxy
+# (e.g. X-Forwarded-For); empty means use the peer address.
+MCP_CLIENT_IP_HEADER = os.getenv("C7_MCP_CLIENT_IP_HEADER", "")
+
+# MCP request counts and latencies, served at GET /metrics
+mcp_metrics = RequestMetrics("mcp")
 
 
 def _error_slug(exc: Exception) -> str:
@@ -37,14 +69,18 @@ async def lifespan(app: FastAPI):
     status = init_schema()
     print(f"Schema initialization: {status}")
 
+    # Size the thread pool used by run_in_threadpool and background tasks
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+
     # Start the MCP session manager (mounted sub-app lifespans are not
     # called by FastAPI, so we manage it here).
     async with mcp.mcp_server.session_manager.run():
         yield
 
-    # Shutdown: Close database connections
+    # Shutdown: Close database and outbound HTTP connections
     print("Closing database connections...")
     close_db()
+    close_http_client()
 
 
 app = FastAPI(
@@ -52,6 +88,7 @@ app = FastAPI(
     version="0.1.0",
     description="Context7-compatible MCP server with library and document management",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -81,6 +118,189 @@ class _McpCorsMiddleware:
         await self.app(scope, receive, _send)
 
 
+class _ApiGZipMiddleware:
+    """Gzip REST responses (library listings, document content, embeddings).
+
+    Only ``/api/`` paths are compressed.  GZipMiddleware holds back the
+    response headers until the first body chunk arrives, which would stall
+    the MCP GET stream that sends headers and then waits for events; MCP
+    POST replies are event streams too, which GZipMiddleware never
+    compresses.  Single records (~400 bytes) are sent as-is; anything
+    from 512 bytes up, such as a listing of two or more libraries, is
+    compressed.  Level 5 gets most of level 9's ratio on JSON and text at
+    a fraction of the CPU cost.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = 512, compresslevel: int = 5
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/api/"):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+class _McpRateLimitMiddleware:
+    """Throttle MCP requests per client with a token bucket.
+
+    Requests carrying an ``Mcp-Session-Id`` that this worker has issued
+    are budgeted per session.  Everything else (``initialize``, stateless
+    mode, unknown or made-up session ids) is budgeted per client address:
+    the peer address, or the last entry of ``client_ip_header`` when the
+    server sits behind a trusted proxy that sets it.  Over-budget requests
+    get ``429`` with ``Retry-After`` and a JSON-RPC error body.
+    """
+
+    MAX_SESSIONS = 10_000
+
+    def __init__(
+        self, app: ASGIApp, rate: float, burst: float, client_ip_header: str = ""
+    ) -> None:
+        self.app = app
+        self.limiter = RateLimiter(rate, burst) if rate > 0 else None
+        self.client_ip_header = client_ip_header.lower().encode()
+        # Session ids seen in our own responses, least recently used first
+        self.sessions: OrderedDict[bytes, None] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            self.limiter is None
+            or scope["type"] != "http"
+            or not scope["path"].startswith("/mcp")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        wait = self.limiter.acquire(self._key(scope))
+        if not wait:
+            await self.app(scope, receive, self._track_sessions(send))
+            return
+
+        response = ORJSONResponse(
+            status_code=429,
+            content={
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32000, "message": "Rate limit exceeded"},
+            },
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+        await response(scope, receive, send)
+
+    def _key(self, scope: Scope) -> bytes | str:
+        """Return the rate-limit bucket key for a request."""
+        headers = dict(scope["headers"])
+        session = headers.get(b"mcp-session-id")
+        if session in self.sessions:
+            self.sessions.move_to_end(session)
+            return session
+
+        if self.client_ip_header:
+            forwarded = headers.get(self.client_ip_header)
+            if forwarded:
+                # The trusted proxy appends the address it saw last
+                return forwarded.rsplit(b",", 1)[-1].strip().decode("latin-1")
+
+        return (scope.get("client") or ("",))[0]
+
+    def _track_sessions(self, send: Send) -> Send:
+        """Wrap ``send`` to remember session ids issued in responses."""
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"mcp-session-id":
+                        self.sessions[value] = None
+                        self.sessions.move_to_end(value)
+                        if len(self.sessions) > self.MAX_SESSIONS:
+                            self.sessions.popitem(last=False)
+            await send(message)
+
+        return _send
+
+
+class _McpMetricsMiddleware:
+    """Record MCP request counts and latencies by JSON-RPC method.
+
+    The request body is copied as the app reads it, so nothing is buffered
+    ahead of the MCP handler and event streams pass through untouched.
+    Latency runs until the last response chunk, so a GET event stream is
+    recorded when it closes.  Methods outside ``METHODS`` (and bodies that
+    are not a single JSON-RPC message) are labelled ``other`` so clients
+    cannot create arbitrary metric labels.
+    """
+
+    METHODS = frozenset(
+        {
+            "initialize",
+            "ping",
+            "tools/list",
+            "tools/call",
+            "notifications/initialized",
+            "notifications/cancelled",
+        }
+    )
+    MAX_BODY = 64 * 1024
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith("/mcp"):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        body = bytearray()
+        status = 500
+
+        async def _receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and len(body) <= self.MAX_BODY:
+                body.extend(message.get("body", b""))
+            return message
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, _receive, _send)
+        finally:
+            self.metrics.observe(
+                self._label(scope["method"], body),
+                status,
+                time.perf_counter() - start,
+            )
+
+    def _label(self, http_method: str, body: bytearray) -> str:
+        """Return the metric label for a request."""
+        if http_method != "POST":
+            return http_method
+        try:
+            method = orjson.loads(body).get("method")
+        except (orjson.JSONDecodeError, AttributeError):
+            return "other"
+        return method if method in self.METHODS else "other"
+
+
+app.add_middleware(
+    _McpRateLimitMiddleware,
+    rate=MCP_RATE_LIMIT,
+    burst=MCP_RATE_BURST,
+    client_ip_header=MCP_CLIENT_IP_HEADER,
+)
+app.add_middleware(_McpMetricsMiddleware, metrics=mcp_metrics)
+app.add_middleware(_ApiGZipMiddleware)
 app.add_middleware(_McpCorsMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -121,6 +341,20 @@ async def bad_request_handler(_request: Request, exc: BadRequestError) -> JSONRe
     )
 
 
+@app.exception_handler(UnreadBodyError)
+async def unread_body_handler(_request: Request, exc: UnreadBodyError) -> JSONResponse:
+    """Handle a request rejected before its body was read as 400.
+
+    The unread body makes the connection unusable, so the response asks
+    the client to close it.
+    """
+    return JSONResponse(
+        status_code=400,
+        content={"error": _error_slug(exc.error), "message": exc.message},
+        headers={"Connection": "close"},
+    )
+
+
 @app.exception_handler(DatabaseError)
 async def database_error_handler(
     _request: Request, exc: DatabaseError
@@ -132,6 +366,22 @@ async def database_error_handler(
     )
 
 
+@app.exception_handler(Exception)
+async def unexpected_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Handle any other unhandled error as 500.
+
+    The traceback is logged server-side; clients get a static body so
+    internal details are not exposed.
+    """
+    logger.exception(
+        "Unhandled error on %s %s", request.method, request.url.path, exc_info=exc
+    )
+    return JSONResponse(
+        status_code=500,
+        content={"error": "internal", "message": "Internal server error"},
+    )
+
+
 # Include REST routers first so they take priority over the catch-all mount.
 app.include_router(libraries.router)
 app.include_router(documents.router)
@@ -147,6 +397,25 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "service": "c7-mcp"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """MCP request and result-cache metrics in the Prometheus text format.
+
+    Returns:
+        Request counts, latency histograms and cache counters for this
+        worker process.
+    """
+    caches = {
+        **document_service.cache_stats(),
+        **library_service.cache_stats(),
+        **mcp_service.cache_stats(),
+    }
+    return PlainTextResponse(
+        mcp_metrics.render() + render_cache_stats(caches),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 # Mount MCP sub-app at root LAST.  The sub-app's internal route is at
 # "/mcp" (the FastMCP default), so POST /mcp → sub-app receives "/mcp".
 # Because this mount comes after all explicit routes, /health and
@@ -0,0 +1,123 @@
+"""In-process result caching.
+
+This module provides a small thread-safe LRU cache with per-entry expiry,
+used by services to serve repeated reads from memory. Callers put a data
+version (e.g. the LanceDB table version) in the key so writes never serve
+stale entries; the TTL only bounds how long unused entries linger.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, TypedDict
+
+
+class CacheStats(TypedDict):
+    """Cache counters.
+
+    Attributes:
+        size: Number of stored entries (including expired ones).
+        maxsize: Maximum number of entries.
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no valid entry.
+    """
+
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    ``None`` is returned for misses, so ``None`` values cannot be cached.
+
+    Example:
+        >>> cache = TTLCache(maxsize=2, ttl=60.0)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted.
+            ttl: Seconds an entry stays valid after it was stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache (must not be None).
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        """Return the cache's size and hit/miss counters."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (including expired ones)."""
+        return len(self._data)
@@ -1,8 +1,11 @@
 """Serve command to run the FastAPI server."""
 
+import os
+from pathlib import Path
+
 import typer
 from granian import Granian
-from granian.constants import Interfaces
+from granian.constants import HTTPModes, Interfaces, Loops
 
 
 def serve(
@@ -10,6 +13,15 @@ def serve(
     port: int = typer.Option(8000, help="Port to bind to"),
     reload: bool = typer.Option(False, help="Enable auto-reload on code changes"),
     workers: int = typer.Option(1, help="Number of worker processes"),
+    http: HTTPModes = typer.Option(
+        HTTPModes.auto, help="HTTP protocol: auto, 1 or 2 (HTTP/2 multiplexing)"
+    ),
+    uds: Path | None = typer.Option(
+        None, help="Bind to a Unix domain socket instead of host/port"
+    ),
+    loop: Loops = typer.Option(
+        Loops.auto, help="Event loop: auto (uvloop when installed) or asyncio"
+    ),
 ) -> None:
     """Start the FastAPI server with Granian.
 
@@ -18,12 +30,26 @@ def serve(
         port: Port number to bind to.
         reload: Enable auto-reload for development.
         workers: Number of worker processes (ignored if reload is True).
+            With more than one, MCP runs stateless because sessions are
+            held in a single worker's memory.
+        http: HTTP protocol version to serve.
+        uds: Unix domain socket path (e.g. behind a reverse proxy on the
+            same host); host and port are ignored when set.
+        loop: Event loop implementation for the workers.
     """
+    workers = 1 if reload else workers
+    if workers > 1:
+        # Inherited by the worker processes before they import the app
+        os.environ.setdefault("C7_MCP_STATELESS", "1")
+
     Granian(
         "c7_mcp.api:app",
         address=host,
         port=port,
         interface=Interfaces.ASGI,
         reload=reload,
-        workers=1 if reload else workers,
+        workers=workers,
+        http=http,
+        uds=uds,
+        loop=loop,
     ).serve()
@@ -5,6 +5,7 @@ for the Context7 MCP server.
 """
 
 import os
+from datetime import timedelta
 from pathlib import Path
 
 import lancedb
@@ -15,9 +16,53 @@ from c7_mcp.models import Document, Library
 # Default database path
 DEFAULT_DB_PATH = os.getenv("LANCEDB_PATH", "./lancedb_data")
 
+# How stale (in seconds) a cached table handle may be before a read checks
+# for newer versions written by other processes. 0 = always check.
+READ_CONSISTENCY_INTERVAL = float(os.getenv("LANCEDB_READ_CONSISTENCY_INTERVAL", "0"))
+
 # Global connection (initialized on first access)
 _db_connection = None
 
+# Opened table handles, reused across calls (reset by close_db)
+_tables: dict[str, lancedb.table.Table] = {}
+
+
+def sql_string(value: str) -> str:
+    """Quote a value as a string literal for a LanceDB filter.
+
+    LanceDB filters are SQL strings without parameter binding, so values
+    are embedded as literals with single quotes doubled; an ID or name
+    containing ``'`` cannot end the literal early or change the filter.
+
+    Args:
+        value: Raw string value.
+
+    Returns:
+        Quoted SQL literal.
+
+    Example:
+        >>> sql_string("O'Reilly")
+        "'O''Reilly'"
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def where_eq(column: str, value: str) -> str:
+    """Build a ``column = 'value'`` filter with the value safely quoted.
+
+    Args:
+        column: Column name (trusted, not quoted).
+        value: Value to compare against.
+
+    Returns:
+        Filter expression for ``where`` or ``delete``.
+
+    Example:
+        >>> where_eq("document_id", "doc-1")
+        "document_id = 'doc-1'"
+    """
+    return f"{column} = {sql_string(value)}"
+
 
 def get_db() -> lancedb.DBConnection:
     """Get or create LanceDB connection.
@@ -34,7 +79,10 @@ def get_db() -> lancedb.DBConnection:
     if _db_connection is None:
         db_path = Path(DEFAULT_DB_PATH)
         db_path.mkdir(parents=True, exist_ok=True)
-        _db_connection = lancedb.connect(str(db_path))
+        _db_connection = lancedb.connect(
+            str(db_path),
+            read_consistency_interval=timedelta(seconds=READ_CONSISTENCY_INTERVAL),
+        )
 
     return _db_connection
 
@@ -82,6 +130,31 @@ def init_schema() -> dict[str, str]:
     return status
 
 
+def _open_table(name: str) -> lancedb.table.Table:
+    """Open a table once and reuse the handle on later calls.
+
+    Listing and opening a table reads the dataset manifest from disk, so the
+    handle is cached instead of being re-opened on every request.  Writes from
+    other processes are still picked up according to
+    ``READ_CONSISTENCY_INTERVAL``.
+
+    Raises:
+        DatabaseError: If the table doesn't exist.
+    """
+    table = _tables.get(name)
+    if table is None:
+        db = get_db()
+
+        if name not in db.table_names():
+            raise DatabaseError(
+                f"{name.capitalize()} table does not exist. Run init_schema() first."
+            )
+
+        table = _tables[name] = db.open_table(name)
+
+    return table
+
+
 def get_libraries_table():
     """Get the libraries table.
 
@@ -89,16 +162,9 @@ def get_libraries_table():
         LanceDB table instance for libraries.
 
     Raises:
-        ValueError: If libraries table doesn't exist.
+        DatabaseError: If libraries table doesn't exist.
     """
-    db = get_db()
-
-    if "libraries" not in db.table_names():
-        raise DatabaseError(
-            "Libraries table does not exist. Run init_schema() first."
-        )
-
-    return db.open_table("libraries")
+    return _open_table("libraries")
 
 
 def get_documents_table():
@@ -108,16 +174,9 @@ def get_documents_table():
         LanceDB table instance for documents.
 
     Raises:
-        ValueError: If documents table doesn't exist.
+        DatabaseError: If documents table doesn't exist.
     """
-    db = get_db()
-
-    if "documents" not in db.table_names():
-        raise DatabaseError(
-            "Documents table does not exist. Run init_schema() first."
-        )
-
-    return db.open_table("documents")
+    return _open_table("documents")
 
 
 def close_db():
@@ -127,6 +186,8 @@ def close_db():
     """
     global _db_connection
 
+    _tables.clear()
+
     if _db_connection is not None:
         # LanceDB doesn't require explicit close, but we reset the connection
         _db_connection = None
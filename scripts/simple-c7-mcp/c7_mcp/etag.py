@@ -0,0 +1,101 @@
+"""Conditional GET helpers.
+
+Collection endpoints tag responses with a weak ETag derived from the
+versions of the LanceDB tables they read. Every write creates a new table
+version, so a client whose ``If-None-Match`` still matches can be answered
+with ``304 Not Modified`` before the service layer runs a query.
+
+Single documents are tagged with a digest of their own fields instead, so
+writes to other documents do not invalidate a client's copy.
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def make_etag(*versions: int) -> str:
+    """Build a weak ETag from one or more table versions.
+
+    Args:
+        *versions: LanceDB versions of the tables behind the resource.
+
+    Returns:
+        Weak ETag header value.
+
+    Example:
+        >>> make_etag(7)
+        'W/"7"'
+        >>> make_etag(7, 12)
+        'W/"7-12"'
+    """
+    return 'W/"' + "-".join(str(version) for version in versions) + '"'
+
+
+def digest_etag(*parts: str) -> str:
+    """Build a weak ETag from a digest of a resource's fields.
+
+    Args:
+        *parts: Field values that make up the representation.
+
+    Returns:
+        Weak ETag header value.
+
+    Example:
+        >>> digest_etag("doc-1", "Title")
+        'W/"384188432d2bf5e6"'
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        # Separator keeps ("ab", "c") and ("a", "bc") apart
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def is_fresh(request: Request, etag: str) -> bool:
+    """Check whether the client's cached copy is still current.
+
+    Args:
+        request: Incoming request.
+        etag: Current ETag for the resource.
+
+    Returns:
+        True if ``If-None-Match`` lists ``etag``. ``*`` is not honoured:
+        the check runs before the resource is looked up, so it cannot
+        tell whether any representation exists.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    tags = [tag.strip() for tag in header.split(",")]
+    # Weak comparison: W/"x" and "x" are equivalent
+    return etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag.
+
+    Args:
+        etag: Current ETag for the resource.
+
+    Returns:
+        304 Not Modified response.
+    """
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach validator headers to a full response.
+
+    Args:
+        response: Response whose headers will be set.
+        etag: Current ETag for the resource.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -32,6 +32,16 @@ class LibraryNotFoundError(NotFoundError):
         super().__init__(f"Library '{library_id}' not found")
 
 
+class LibrariesNotFoundError(NotFoundError):
+    """One or more libraries referenced by a bulk request not found."""
+
+    def __init__(self, library_ids: list[str]) -> None:
+        """Initialize with every missing library ID."""
+        self.library_ids = library_ids
+        names = ", ".join(f"'{library_id}'" for library_id in library_ids)
+        super().__init__(f"Libraries not found: {names}")
+
+
 class DocumentNotFoundError(NotFoundError):
     """Document not found by ID."""
 
@@ -102,6 +112,20 @@ class URLFetchError(BadRequestError):
         super().__init__(f"Failed to fetch URL '{url}': {reason}")
 
 
+class UnreadBodyError(BadRequestError):
+    """Request rejected before its body was read.
+
+    Wraps the underlying error, whose slug and message are reported. The
+    server drops the connection after such a response, so the handler
+    tells the client not to reuse it.
+    """
+
+    def __init__(self, error: BadRequestError) -> None:
+        """Initialize with the error that caused the rejection."""
+        self.error = error
+        super().__init__(error.message)
+
+
 # --- 500 Internal ---
 
 
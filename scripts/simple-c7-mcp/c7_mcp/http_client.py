@@ -0,0 +1,50 @@
+"""Shared outbound HTTP client.
+
+This module provides a process-wide HTTP client so that outbound fetches
+reuse pooled keep-alive connections instead of paying a DNS lookup and
+TCP/TLS handshake on every request. HTTP/2 is negotiated where the server
+supports it, so concurrent fetches from one host (e.g. context7.com) share
+a single connection.
+"""
+
+import httpx
+
+USER_AGENT = "c7-mcp/1.0"
+
+# Global client (initialized on first access)
+_http_client: httpx.Client | None = None
+
+
+def get_http_client() -> httpx.Client:
+    """Get or create the shared HTTP client.
+
+    Returns:
+        httpx client with a keep-alive (HTTP/1.1 or HTTP/2) connection pool.
+
+    Example:
+        >>> response = get_http_client().get("https://example.com/llms.txt")
+    """
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.Client(
+            headers={"User-Agent": USER_AGENT},
+            timeout=30.0,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections.
+
+    Call this during application shutdown.
+    """
+    global _http_client
+
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
@@ -0,0 +1,136 @@
+"""In-process request metrics.
+
+This module keeps request counts and latency histograms and renders them
+in the Prometheus text exposition format, so any Prometheus-compatible
+scraper can read them without a client library. State lives in the
+worker process, so with several workers each one reports its own share.
+"""
+
+from bisect import bisect_left
+
+from c7_mcp.cache import CacheStats
+
+# Upper bounds in seconds (Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Latency histogram with fixed bucket upper bounds.
+
+    Example:
+        >>> histogram = Histogram(buckets=(0.1, 1.0))
+        >>> histogram.observe(0.05)
+        >>> histogram.observe(0.5)
+        >>> histogram.cumulative()
+        [1, 2, 2]
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds in seconds.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed duration in seconds.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[int]:
+        """Return cumulative counts per bucket, ending with +Inf."""
+        total = 0
+        result = []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class RequestMetrics:
+    """Request counters and latency histograms labelled by method.
+
+    Not thread-safe; use it from the event loop only.
+    """
+
+    def __init__(
+        self, prefix: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            prefix: Metric name prefix (e.g. ``"mcp"``).
+            buckets: Histogram bucket upper bounds in seconds.
+        """
+        self.prefix = prefix
+        self.buckets = buckets
+        self._requests: dict[tuple[str, int], int] = {}
+        self._durations: dict[str, Histogram] = {}
+
+    def observe(self, method: str, status: int, seconds: float) -> None:
+        """Record a finished request.
+
+        Args:
+            method: Label for the request kind; keep the set of values small.
+            status: HTTP status code of the response.
+            seconds: Time from request start to the end of the response.
+        """
+        key = (method, status)
+        self._requests[key] = self._requests.get(key, 0) + 1
+
+        histogram = self._durations.get(method)
+        if histogram is None:
+            histogram = self._durations[method] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        requests = f"{self.prefix}_requests_total"
+        duration = f"{self.prefix}_request_duration_seconds"
+
+        lines = [f"# TYPE {requests} counter"]
+        for (method, status), count in sorted(self._requests.items()):
+            lines.append(f'{requests}{{method="{method}",status="{status}"}} {count}')
+
+        lines.append(f"# TYPE {duration} histogram")
+        for method, histogram in sorted(self._durations.items()):
+            bounds = [*map(str, histogram.buckets), "+Inf"]
+            for bound, count in zip(bounds, histogram.cumulative(), strict=True):
+                lines.append(
+                    f'{duration}_bucket{{method="{method}",le="{bound}"}} {count}'
+                )
+            lines.append(f'{duration}_sum{{method="{method}"}} {histogram.sum}')
+            lines.append(f'{duration}_count{{method="{method}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def render_cache_stats(caches: dict[str, CacheStats]) -> str:
+    """Render result-cache counters in the Prometheus text exposition format.
+
+    Args:
+        caches: Stats keyed by cache name.
+
+    Returns:
+        Hit and miss counters and an entry-count gauge per cache.
+    """
+    lines = []
+    for metric, kind, field in (
+        ("cache_hits_total", "counter", "hits"),
+        ("cache_misses_total", "counter", "misses"),
+        ("cache_entries", "gauge", "size"),
+    ):
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, stats in sorted(caches.items()):
+            lines.append(f'{metric}{{cache="{name}"}} {stats[field]}')
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,50 @@
+"""Embedding quantization for transfer.
+
+Vectors are stored and searched as float32. Clients that can tolerate a
+small precision loss may download them as int8 with a per-vector scale
+and zero point, a quarter of the float32 size:
+``value ≈ (q - zero_point) * scale``.
+"""
+
+import numpy as np
+
+
+def quantize_int8(vector: np.ndarray) -> tuple[np.ndarray, float, int]:
+    """Quantize a vector to int8 with an asymmetric affine mapping.
+
+    The vector's range, widened to include 0.0 so that zero maps exactly,
+    is spread over ``[-128, 127]``.
+
+    Args:
+        vector: Float vector to quantize.
+
+    Returns:
+        Tuple of (int8 values, scale, zero point).
+
+    Example:
+        >>> q, scale, zero_point = quantize_int8(np.array([0.0, 1.0]))
+        >>> q.tolist(), zero_point
+        ([-128, 127], -128)
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    low = float(vector.min(initial=0.0))
+    high = float(vector.max(initial=0.0))
+    # A constant vector has no range; any positive scale represents it
+    scale = (high - low) / 255.0 or 1.0
+    zero_point = int(round(-128 - low / scale))
+    quantized = np.clip(np.round(vector / scale + zero_point), -128, 127)
+    return quantized.astype(np.int8), scale, zero_point
+
+
+def dequantize_int8(quantized: np.ndarray, scale: float, zero_point: int) -> np.ndarray:
+    """Map int8 values back to float32.
+
+    Args:
+        quantized: Values produced by :func:`quantize_int8`.
+        scale: Scale returned with them.
+        zero_point: Zero point returned with them.
+
+    Returns:
+        Approximate float32 vector.
+    """
+    return (quantized.astype(np.float32) - zero_point) * np.float32(scale)
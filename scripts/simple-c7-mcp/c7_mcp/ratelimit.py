@@ -0,0 +1,88 @@
+"""In-process request rate limiting.
+
+This module provides a token-bucket limiter keyed by client (MCP session
+or address). State lives in the worker process, so with several workers
+each one enforces the budget independently.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second.
+
+    Example:
+        >>> bucket = TokenBucket(rate=1.0, capacity=2.0)
+        >>> bucket.acquire(), bucket.acquire()
+        (0.0, 0.0)
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens (the allowed burst).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def acquire(self) -> float:
+        """Take one token if available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds to wait until
+            one becomes available.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+
+        return (1.0 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Per-key token buckets with a bounded number of tracked keys.
+
+    Not thread-safe; use it from the event loop only.
+    """
+
+    def __init__(self, rate: float, burst: float, max_keys: int = 10_000) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second allowed per key.
+            burst: Requests allowed at once before throttling starts.
+            max_keys: Keys tracked before the least recently seen is dropped.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[Hashable, TokenBucket] = OrderedDict()
+
+    def acquire(self, key: Hashable) -> float:
+        """Take one request from ``key``'s budget.
+
+        Args:
+            key: Client identifier.
+
+        Returns:
+            0.0 if the request is allowed, otherwise the seconds to wait.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        return bucket.acquire()
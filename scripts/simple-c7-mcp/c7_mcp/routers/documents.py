@@ -2,17 +2,33 @@
 
 This module implements RESTful CRUD endpoints for document management,
 including content upload, URL fetching, and various update operations.
+Errors propagate to the global exception handlers registered in api.py.
+Service calls block on LanceDB and network I/O, so they run in the worker
+thread pool.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import Literal
 
-from c7_mcp.exceptions import C7Error
+import numpy as np
+from fastapi import APIRouter, BackgroundTasks, Body, Header, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from c7_mcp.etag import digest_etag, is_fresh, not_modified, set_etag
+from c7_mcp.exceptions import (
+    BadRequestError,
+    C7Error,
+    EmbeddingDimensionError,
+    UnreadBodyError,
+)
+from c7_mcp.quantize import quantize_int8
 from c7_mcp.schemas.document import (
     ContentUpdate,
     DocumentContent,
     DocumentCreate,
     DocumentEmbeddings,
     DocumentFetch,
+    DocumentFetchResult,
     DocumentPretty,
     DocumentResponse,
     DocumentTitle,
@@ -23,8 +39,67 @@ from c7_mcp.schemas.document import (
 )
 from c7_mcp.schemas.library import DeleteResponse
 from c7_mcp.services import document as document_service
+from c7_mcp.services import library as library_service
+
+# Handlers return ORJSONResponse directly, so FastAPI skips response_model
+# validation and jsonable_encoder; response_model only documents the schema.
+router = APIRouter(
+    prefix="/api/v1/documents",
+    tags=["documents"],
+    default_response_class=ORJSONResponse,
+)
+
+# Fields copied from service results into DocumentResponse
+_RESPONSE_FIELDS = tuple(DocumentResponse.model_fields)
+
+
+def _metadata(data: dict) -> dict:
+    """Select the DocumentResponse fields from a service result.
+
+    Args:
+        data: DocumentData returned by the document service.
+
+    Returns:
+        Dict with the document metadata fields (no content).
+    """
+    return {field: data[field] for field in _RESPONSE_FIELDS}
+
+
+def _document_etag(data: dict) -> str:
+    """Build the ETag for the single-document read endpoints.
 
-router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
+    Covers every field those endpoints return, so it changes only when
+    this document does.
+
+    Args:
+        data: DocumentData returned by the document service.
+
+    Returns:
+        Weak ETag header value.
+    """
+    return digest_etag(
+        data["id"],
+        data["title"],
+        data["library_id"],
+        data["content"],
+        str(data["has_embeddings"]),
+    )
+
+
+def _to_response(data: dict, status_code: int = 200) -> ORJSONResponse:
+    """Serialize a service result as a DocumentResponse body.
+
+    The service layer is the trust boundary, so the dict is rendered by
+    orjson as-is instead of being re-validated against the schema.
+
+    Args:
+        data: DocumentData returned by the document service.
+        status_code: HTTP status code of the response.
+
+    Returns:
+        JSON response with the document metadata.
+    """
+    return ORJSONResponse(_metadata(data), status_code=status_code)
 
 
 @router.get("", response_model=list[DocumentResponse])
@@ -32,7 +107,7 @@ async def list_documents(
     library_id: str | None = Query(None, description="Filter by library ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum documents to return"),
     offset: int = Query(0, ge=0, description="Number of documents to skip"),
-) -> list[DocumentResponse]:
+) -> ORJSONResponse:
     """List documents with optional filtering and pagination.
 
     Args:
@@ -46,35 +121,24 @@ async def list_documents(
     Raises:
         HTTPException: 500 if internal server error.
     """
-    try:
-        documents = document_service.list_documents(
-            library_id=library_id, limit=limit, offset=offset
-        )
-        return [
-            DocumentResponse(
-                id=doc["id"],
-                title=doc["title"],
-                library_id=doc["library_id"],
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
-                has_embeddings=doc["has_embeddings"],
-            )
-            for doc in documents
-        ]
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to list documents: {str(e)}"
-        )
+    documents = await run_in_threadpool(
+        document_service.list_documents,
+        library_id=library_id,
+        limit=limit,
+        offset=offset,
+    )
+    return ORJSONResponse([_metadata(doc) for doc in documents])
 
 
 @router.post("", response_model=DocumentResponse, status_code=201)
-async def create_document(document: DocumentCreate) -> DocumentResponse:
+async def create_document(
+    document: DocumentCreate, background: BackgroundTasks
+) -> ORJSONResponse:
     """Create a document by uploading content.
 
     Args:
         document: Document creation data (title, content, library_id).
+        background: Tasks run after the response is sent.
 
     Returns:
         Created document with metadata.
@@ -83,34 +147,55 @@ async def create_document(document: DocumentCreate) -> DocumentResponse:
         HTTPException: 404 if library not found.
         HTTPException: 500 if internal server error.
     """
-    try:
-        data = document_service.create_document(
-            title=document.title,
-            content=document.content,
-            library_id=document.library_id,
-        )
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to create document: {str(e)}"
-        )
+    data = await run_in_threadpool(
+        document_service.create_document,
+        title=document.title,
+        content=document.content,
+        library_id=document.library_id,
+    )
+    background.add_task(library_service.refresh_document_counts, {data["library_id"]})
+    return _to_response(data, status_code=201)
+
+
+@router.post("/bulk", response_model=list[DocumentResponse], status_code=201)
+async def create_documents(
+    background: BackgroundTasks,
+    documents: list[DocumentCreate] = Body(..., min_length=1, max_length=1000),
+) -> ORJSONResponse:
+    """Create many documents from uploaded content in one write.
+
+    The request is all-or-nothing: if any library is missing, no document
+    is created.
+
+    Args:
+        background: Tasks run after the response is sent.
+        documents: Up to 1000 documents (title, content, library_id).
+
+    Returns:
+        Created documents with metadata, in request order.
+
+    Raises:
+        HTTPException: 404 if any library not found.
+    """
+    created = await run_in_threadpool(
+        document_service.create_documents,
+        [(doc.title, doc.content, doc.library_id) for doc in documents],
+    )
+    background.add_task(
+        library_service.refresh_document_counts, {doc["library_id"] for doc in created}
+    )
+    return ORJSONResponse([_metadata(doc) for doc in created], status_code=201)
 
 
 @router.post("/fetch", response_model=DocumentResponse, status_code=201)
-async def fetch_document(document: DocumentFetch) -> DocumentResponse:
+async def fetch_document(
+    document: DocumentFetch, background: BackgroundTasks
+) -> ORJSONResponse:
     """Create a document by fetching content from URL.
 
     Args:
         document: Document fetch data (title, url, library_id).
+        background: Tasks run after the response is sent.
 
     Returns:
         Created document with metadata.
@@ -119,61 +204,78 @@ async def fetch_document(document: DocumentFetch) -> DocumentResponse:
         HTTPException: 404 if library not found.
         HTTPException: 400 if URL fetch fails.
     """
-    try:
-        data = document_service.fetch_document(
-            title=document.title,
-            url=str(document.url),
-            library_id=document.library_id,
-        )
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to fetch document: {str(e)}"
-        )
+    data = await run_in_threadpool(
+        document_service.fetch_document,
+        title=document.title,
+        url=str(document.url),
+        library_id=document.library_id,
+    )
+    background.add_task(library_service.refresh_document_counts, {data["library_id"]})
+    return _to_response(data, status_code=201)
+
+
+@router.post("/fetch/bulk", response_model=list[DocumentFetchResult])
+async def fetch_documents_bulk(
+    background: BackgroundTasks,
+    documents: list[DocumentFetch] = Body(..., min_length=1, max_length=100),
+) -> ORJSONResponse:
+    """Create documents by fetching many URLs concurrently.
+
+    Items succeed or fail independently; failures are reported per item
+    instead of failing the whole request.
+
+    Args:
+        background: Tasks run after the response is sent.
+        documents: Up to 100 document fetch requests (title, url, library_id).
+
+    Returns:
+        One result per requested document, in request order.
+    """
+    results = await run_in_threadpool(
+        document_service.fetch_documents_bulk,
+        [(doc.title, str(doc.url), doc.library_id) for doc in documents],
+    )
+    touched = {
+        result["library_id"] for result in results if not isinstance(result, C7Error)
+    }
+    if touched:
+        background.add_task(library_service.refresh_document_counts, touched)
+    return ORJSONResponse(
+        [
+            {"url": str(doc.url), "document": None, "error": result.message}
+            if isinstance(result, C7Error)
+            else {"url": str(doc.url), "document": _metadata(result), "error": None}
+            for doc, result in zip(documents, results, strict=True)
+        ]
+    )
 
 
 @router.get("/{doc_id}", response_model=DocumentResponse)
-async def get_document(doc_id: str) -> DocumentResponse:
+async def get_document(doc_id: str, request: Request) -> Response:
     """Get document metadata by ID (without content).
 
     Args:
         doc_id: Document unique identifier.
+        request: Incoming request (checked for If-None-Match).
 
     Returns:
-        Document metadata (no content).
+        Document metadata (no content), or 304 if the client copy is current.
 
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        data = document_service.get_document(doc_id)
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get document: {str(e)}"
-        )
+    data = await run_in_threadpool(document_service.get_document, doc_id)
+    etag = _document_etag(data)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    response = _to_response(data)
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/{doc_id}/content", response_model=DocumentContent)
-async def get_document_content(doc_id: str) -> DocumentContent:
+async def get_document_content(doc_id: str) -> ORJSONResponse:
     """Get raw document content.
 
     Args:
@@ -185,67 +287,60 @@ async def get_document_content(doc_id: str) -> DocumentContent:
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        content = document_service.get_content(doc_id)
-        return DocumentContent(content=content)
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get content: {str(e)}"
-        )
+    content = await run_in_threadpool(document_service.get_content, doc_id)
+    return ORJSONResponse({"content": content})
 
 
 @router.get("/{doc_id}/pretty", response_model=DocumentPretty)
-async def get_document_pretty(doc_id: str) -> DocumentPretty:
+async def get_document_pretty(doc_id: str, request: Request) -> Response:
     """Get formatted document (title + content).
 
     Args:
         doc_id: Document unique identifier.
+        request: Incoming request (checked for If-None-Match).
 
     Returns:
-        Formatted document with title and content.
+        Formatted document with title and content, or 304 if unchanged.
 
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        data = document_service.get_document(doc_id)
-        return DocumentPretty(title=data["title"], content=data["content"])
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get document: {str(e)}"
-        )
+    data = await run_in_threadpool(document_service.get_document, doc_id)
+    etag = _document_etag(data)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    response = ORJSONResponse({"title": data["title"], "content": data["content"]})
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/{doc_id}/title", response_model=DocumentTitle)
-async def get_document_title(doc_id: str) -> DocumentTitle:
+async def get_document_title(doc_id: str, request: Request) -> Response:
     """Get document title only.
 
     Args:
         doc_id: Document unique identifier.
+        request: Incoming request (checked for If-None-Match).
 
     Returns:
-        Document title.
+        Document title, or 304 if unchanged.
 
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        data = document_service.get_document(doc_id)
-        return DocumentTitle(title=data["title"])
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get title: {str(e)}"
-        )
+    data = await run_in_threadpool(document_service.get_document, doc_id)
+    etag = _document_etag(data)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    response = ORJSONResponse({"title": data["title"]})
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/{doc_id}/embeddings", response_model=DocumentEmbeddings)
-async def get_document_embeddings(doc_id: str) -> DocumentEmbeddings:
+async def get_document_embeddings(doc_id: str) -> ORJSONResponse:
     """Get document embeddings.
 
     Args:
@@ -257,28 +352,76 @@ async def get_document_embeddings(doc_id: str) -> DocumentEmbeddings:
     Raises:
         HTTPException: 404 if document not found or has no embeddings.
     """
-    try:
-        data = document_service.get_embeddings(doc_id)
-        return DocumentEmbeddings(
-            embeddings=data["embeddings"],
-            dimension=data["dimension"],
-            model=data["model"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get embeddings: {str(e)}"
-        )
+    data = await run_in_threadpool(document_service.get_embeddings, doc_id)
+    return ORJSONResponse(
+        {
+            "embeddings": data["embeddings"],
+            "dimension": data["dimension"],
+            "model": data["model"],
+        }
+    )
+
+
+@router.get(
+    "/{doc_id}/embeddings:bin",
+    response_class=Response,
+    responses={200: {"content": {"application/octet-stream": {}}}},
+)
+async def get_document_embeddings_binary(
+    doc_id: str,
+    dtype: Literal["float32", "int8"] = Query(
+        "float32", description="Element type of the returned vector"
+    ),
+) -> Response:
+    """Get document embeddings as raw little-endian bytes.
+
+    The binary counterpart of ``PATCH /{doc_id}/embeddings:bin``: about a
+    third of the size of the JSON form and no float formatting. The
+    dimension and model are returned in the ``X-Dim`` and
+    ``X-Embedding-Model`` headers.
+
+    With ``dtype=int8`` the vector is quantized to one byte per value and
+    the ``X-Scale`` and ``X-Zero-Point`` headers give the mapping back:
+    ``value ≈ (q - zero_point) * scale``.
+
+    Args:
+        doc_id: Document unique identifier.
+        dtype: ``float32`` (exact) or ``int8`` (quantized).
+
+    Returns:
+        Response whose body is the vector bytes.
+
+    Raises:
+        HTTPException: 404 if document not found or has no embeddings.
+    """
+    data = await run_in_threadpool(document_service.get_embeddings, doc_id)
+    headers = {"X-Dim": str(data["dimension"])}
+    if data["model"]:
+        headers["X-Embedding-Model"] = data["model"]
+
+    if dtype == "int8":
+        quantized, scale, zero_point = quantize_int8(data["embeddings"])
+        headers["X-Scale"] = repr(scale)
+        headers["X-Zero-Point"] = str(zero_point)
+        content = quantized.tobytes()
+    else:
+        content = data["embeddings"].astype("<f4", copy=False).tobytes()
+
+    return Response(
+        content=content, media_type="application/octet-stream", headers=headers
+    )
 
 
 @router.put("/{doc_id}", response_model=DocumentResponse)
-async def update_document(doc_id: str, document: DocumentUpdate) -> DocumentResponse:
+async def update_document(
+    doc_id: str, document: DocumentUpdate, background: BackgroundTasks
+) -> ORJSONResponse:
     """Update document (full update).
 
     Args:
         doc_id: Document unique identifier.
         document: Full document update data.
+        background: Tasks run after the response is sent.
 
     Returns:
         Updated document metadata.
@@ -286,33 +429,24 @@ async def update_document(doc_id: str, document: DocumentUpdate) -> DocumentResp
     Raises:
         HTTPException: 404 if document or target library not found.
     """
-    try:
-        data = document_service.full_update_document(
-            doc_id=doc_id,
-            title=document.title,
-            content=document.content,
-            library_id=document.library_id,
-        )
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to update document: {str(e)}"
-        )
+    data, previous_library_id = await run_in_threadpool(
+        document_service.full_update_document,
+        doc_id=doc_id,
+        title=document.title,
+        content=document.content,
+        library_id=document.library_id,
+    )
+    background.add_task(
+        library_service.refresh_document_counts,
+        {previous_library_id, data["library_id"]},
+    )
+    return _to_response(data)
 
 
 @router.patch("/{doc_id}/content", response_model=DocumentResponse)
 async def update_document_content(
     doc_id: str, content_update: ContentUpdate
-) -> DocumentResponse:
+) -> ORJSONResponse:
     """Update document content only.
 
     Args:
@@ -325,28 +459,16 @@ async def update_document_content(
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        data = document_service.update_content(doc_id, content_update.content)
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to update content: {str(e)}"
-        )
+    data = await run_in_threadpool(
+        document_service.update_content, doc_id, content_update.content
+    )
+    return _to_response(data)
 
 
 @router.patch("/{doc_id}/title", response_model=DocumentResponse)
 async def update_document_title(
     doc_id: str, title_update: TitleUpdate
-) -> DocumentResponse:
+) -> ORJSONResponse:
     """Update document title only.
 
     Args:
@@ -359,33 +481,22 @@ async def update_document_title(
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        data = document_service.update_title(doc_id, title_update.title)
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to update title: {str(e)}"
-        )
+    data = await run_in_threadpool(
+        document_service.update_title, doc_id, title_update.title
+    )
+    return _to_response(data)
 
 
 @router.patch("/{doc_id}/library", response_model=DocumentResponse)
 async def update_document_library(
-    doc_id: str, library_assignment: LibraryAssignment
-) -> DocumentResponse:
+    doc_id: str, library_assignment: LibraryAssignment, background: BackgroundTasks
+) -> ORJSONResponse:
     """Move document to a different library.
 
     Args:
         doc_id: Document unique identifier.
         library_assignment: Target library ID.
+        background: Tasks run after the response is sent.
 
     Returns:
         Updated document metadata.
@@ -393,30 +504,20 @@ async def update_document_library(
     Raises:
         HTTPException: 404 if document or target library not found.
     """
-    try:
-        data = document_service.update_library(
-            doc_id, library_assignment.library_id
-        )
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to move document: {str(e)}"
-        )
+    data, previous_library_id = await run_in_threadpool(
+        document_service.update_library, doc_id, library_assignment.library_id
+    )
+    background.add_task(
+        library_service.refresh_document_counts,
+        {previous_library_id, data["library_id"]},
+    )
+    return _to_response(data)
 
 
 @router.patch("/{doc_id}/embeddings", response_model=DocumentResponse)
 async def update_document_embeddings(
     doc_id: str, embeddings_update: EmbeddingsUpdate
-) -> DocumentResponse:
+) -> ORJSONResponse:
     """Update document embeddings.
 
     Args:
@@ -430,34 +531,87 @@ async def update_document_embeddings(
         HTTPException: 404 if document not found.
         HTTPException: 400 if embedding dimension inconsistent.
     """
-    try:
-        data = document_service.update_embeddings(
-            doc_id,
-            embeddings_update.embeddings,
-            model=embeddings_update.model,
+    data = await run_in_threadpool(
+        document_service.update_embeddings,
+        doc_id,
+        np.asarray(embeddings_update.embeddings, dtype=np.float32),
+        model=embeddings_update.model,
+    )
+    return _to_response(data)
+
+
+@router.patch("/{doc_id}/embeddings:bin", response_model=DocumentResponse)
+async def update_document_embeddings_binary(
+    doc_id: str,
+    request: Request,
+    dim: int = Header(..., alias="X-Dim", ge=1, description="Embedding dimension"),
+    model: str | None = Query(None, description="Model used to generate embeddings"),
+) -> ORJSONResponse:
+    """Update document embeddings from raw little-endian float32 bytes.
+
+    Avoids JSON parsing for large vectors: the request body
+    (``Content-Type: application/octet-stream``) is decoded directly into
+    a float32 array.
+
+    Args:
+        doc_id: Document unique identifier.
+        request: Incoming request carrying the raw vector bytes.
+        dim: Embedding dimension declared by the client (X-Dim header).
+        model: Model used to generate embeddings (optional).
+
+    Returns:
+        Updated document metadata.
+
+    Raises:
+        HTTPException: 404 if document not found.
+        HTTPException: 400 if body size or dimension is inconsistent, or
+            the dimension does not match the vector column.
+    """
+    # Validate the declared size before reading so an oversized body is
+    # rejected without being buffered
+    if dim != document_service.EMBEDDING_DIM:
+        raise UnreadBodyError(
+            EmbeddingDimensionError(dim, document_service.EMBEDDING_DIM)
         )
-        return DocumentResponse(
-            id=data["id"],
-            title=data["title"],
-            library_id=data["library_id"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            has_embeddings=data["has_embeddings"],
+    expected = dim * 4
+    length = request.headers.get("content-length")
+    if length is not None and length != str(expected):
+        raise UnreadBodyError(
+            BadRequestError(
+                f"Body is {length} bytes; expected {expected} for X-Dim {dim} float32"
+            )
         )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to update embeddings: {str(e)}"
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > expected:
+            raise UnreadBodyError(
+                BadRequestError(
+                    f"Body exceeds {expected} bytes for X-Dim {dim} float32"
+                )
+            )
+    if len(body) != expected:
+        raise BadRequestError(
+            f"Body is {len(body)} bytes; expected {expected} for X-Dim {dim} float32"
         )
 
+    data = await run_in_threadpool(
+        document_service.update_embeddings,
+        doc_id,
+        np.frombuffer(body, dtype="<f4"),
+        model=model,
+    )
+    return _to_response(data)
+
 
 @router.delete("/{doc_id}", response_model=DeleteResponse)
-async def delete_document(doc_id: str) -> DeleteResponse:
+async def delete_document(doc_id: str, background: BackgroundTasks) -> ORJSONResponse:
     """Delete a document.
 
     Args:
         doc_id: Document unique identifier.
+        background: Tasks run after the response is sent.
 
     Returns:
         Deletion status and message.
@@ -465,14 +619,8 @@ async def delete_document(doc_id: str) -> DeleteResponse:
     Raises:
         HTTPException: 404 if document not found.
     """
-    try:
-        document_service.delete_document(doc_id)
-        return DeleteResponse(
-            success=True, message=f"Document '{doc_id}' deleted successfully"
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to delete document: {str(e)}"
-        )
+    library_id = await run_in_threadpool(document_service.delete_document, doc_id)
+    background.add_task(library_service.refresh_document_counts, {library_id})
+    return ORJSONResponse(
+        {"success": True, "message": f"Document '{doc_id}' deleted successfully"}
+    )
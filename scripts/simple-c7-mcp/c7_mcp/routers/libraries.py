@@ -1,11 +1,18 @@
 """Library management router.
 
 This module implements RESTful CRUD endpoints for library management.
+Service calls block on LanceDB I/O, so they run in the worker thread pool.
+Errors propagate to the global exception handlers registered in api.py.
 """
 
-from fastapi import APIRouter, HTTPException
+from collections.abc import Iterator
 
-from c7_mcp.exceptions import C7Error
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from c7_mcp.etag import is_fresh, make_etag, not_modified, set_etag
 from c7_mcp.schemas.library import (
     DeleteResponse,
     LibraryCreate,
@@ -15,32 +22,71 @@ from c7_mcp.schemas.library import (
 )
 from c7_mcp.services import library as library_service
 
-router = APIRouter(prefix="/api/v1/libraries", tags=["libraries"])
+# Handlers return ORJSONResponse directly, so FastAPI skips response_model
+# validation and jsonable_encoder; response_model only documents the schema.
+# LibraryData has exactly the LibraryResponse fields, so service results are
+# rendered as-is.
+router = APIRouter(
+    prefix="/api/v1/libraries",
+    tags=["libraries"],
+    default_response_class=ORJSONResponse,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _ndjson_lines(libraries: Iterator[dict]) -> Iterator[bytes]:
+    """Encode libraries as newline-delimited JSON.
+
+    Args:
+        libraries: Library data produced by the library service.
+
+    Yields:
+        One JSON document per library, terminated by a newline.
+    """
+    for library in libraries:
+        yield orjson.dumps(library) + b"\n"
 
 
 @router.get("", response_model=list[LibraryResponse])
-async def list_libraries() -> list[LibraryResponse]:
+async def list_libraries(request: Request) -> Response:
     """List all libraries.
 
+    Clients sending ``Accept: application/x-ndjson`` get the same
+    libraries as a stream with one library per line instead of a single
+    JSON array.
+
+    Args:
+        request: Incoming request (checked for If-None-Match and Accept).
+
     Returns:
-        List of all libraries with metadata and document counts.
+        List of all libraries with metadata and document counts, or 304 if
+        the client copy is current.
 
     Raises:
         HTTPException: 500 if internal server error.
     """
-    try:
-        libraries = library_service.list_libraries()
-        return [LibraryResponse(**lib) for lib in libraries]
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to list libraries: {str(e)}"
+    etag = make_etag(*await run_in_threadpool(library_service.get_listing_version))
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # Starlette iterates sync generators in the thread pool
+        stream = StreamingResponse(
+            _ndjson_lines(library_service.iter_libraries()),
+            media_type=NDJSON_MEDIA_TYPE,
         )
+        set_etag(stream, etag)
+        return stream
+
+    libraries = await run_in_threadpool(library_service.list_libraries_with_counts)
+    response = ORJSONResponse(libraries)
+    set_etag(response, etag)
+    return response
 
 
 @router.post("", response_model=LibraryResponse, status_code=201)
-async def create_library(library: LibraryCreate) -> LibraryResponse:
+async def create_library(library: LibraryCreate) -> ORJSONResponse:
     """Create a new library.
 
     Args:
@@ -67,34 +113,28 @@ async def create_library(library: LibraryCreate) -> LibraryResponse:
         >>>   "keywords": ["web", "framework", "async"]
         >>> }
     """
-    try:
-        library_data = library_service.create_library(
-            name=library.name,
-            language=library.language,
-            ecosystem=library.ecosystem,
-            description=library.description,
-            short_description=library.short_description,
-            context7_id=library.context7_id,
-            aliases=library.aliases,
-            keywords=library.keywords,
-            category=library.category,
-            homepage_url=library.homepage_url,
-            repository_url=library.repository_url,
-            logo_url=library.logo_url,
-            author=library.author,
-            license=library.license,
-        )
-        return LibraryResponse(**library_data)
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to create library: {str(e)}"
-        )
+    library_data = await run_in_threadpool(
+        library_service.create_library,
+        name=library.name,
+        language=library.language,
+        ecosystem=library.ecosystem,
+        description=library.description,
+        short_description=library.short_description,
+        context7_id=library.context7_id,
+        aliases=library.aliases,
+        keywords=library.keywords,
+        category=library.category,
+        homepage_url=library.homepage_url,
+        repository_url=library.repository_url,
+        logo_url=library.logo_url,
+        author=library.author,
+        license=library.license,
+    )
+    return ORJSONResponse(library_data, status_code=201)
 
 
 @router.get("/{library_id}", response_model=LibraryResponse)
-async def get_library(library_id: str) -> LibraryResponse:
+async def get_library(library_id: str) -> ORJSONResponse:
     """Get library details by ID.
 
     Args:
@@ -106,21 +146,12 @@ async def get_library(library_id: str) -> LibraryResponse:
     Raises:
         HTTPException: 404 if library not found.
     """
-    try:
-        data = library_service.get_library(library_id)
-        return LibraryResponse(**data)
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get library: {str(e)}"
-        )
+    data = await run_in_threadpool(library_service.get_library, library_id)
+    return ORJSONResponse(data)
 
 
 @router.put("/{library_id}", response_model=LibraryResponse)
-async def update_library(
-    library_id: str, library: LibraryUpdate
-) -> LibraryResponse:
+async def update_library(library_id: str, library: LibraryUpdate) -> ORJSONResponse:
     """Update library (full update).
 
     Args:
@@ -134,25 +165,19 @@ async def update_library(
         HTTPException: 404 if library not found.
         HTTPException: 409 if new name already exists.
     """
-    try:
-        data = library_service.update_library(
-            library_id=library_id,
-            name=library.name,
-            description=library.description or "",
-        )
-        return LibraryResponse(**data)
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to update library: {str(e)}"
-        )
+    data = await run_in_threadpool(
+        library_service.update_library,
+        library_id=library_id,
+        name=library.name,
+        description=library.description or "",
+    )
+    return ORJSONResponse(data)
 
 
 @router.patch("/{library_id}", response_model=LibraryResponse)
 async def partial_update_library(
     library_id: str, library: LibraryPartialUpdate
-) -> LibraryResponse:
+) -> ORJSONResponse:
     """Update library (partial update).
 
     Args:
@@ -166,23 +191,17 @@ async def partial_update_library(
         HTTPException: 404 if library not found.
         HTTPException: 409 if new name already exists.
     """
-    try:
-        data = library_service.partial_update_library(
-            library_id=library_id,
-            name=library.name,
-            description=library.description,
-        )
-        return LibraryResponse(**data)
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to update library: {str(e)}"
-        )
+    data = await run_in_threadpool(
+        library_service.partial_update_library,
+        library_id=library_id,
+        name=library.name,
+        description=library.description,
+    )
+    return ORJSONResponse(data)
 
 
 @router.delete("/{library_id}", response_model=DeleteResponse)
-async def delete_library(library_id: str) -> DeleteResponse:
+async def delete_library(library_id: str) -> ORJSONResponse:
     """Delete a library.
 
     Args:
@@ -195,14 +214,7 @@ async def delete_library(library_id: str) -> DeleteResponse:
         HTTPException: 404 if library not found.
         HTTPException: 400 if library has documents.
     """
-    try:
-        library_service.delete_library(library_id)
-        return DeleteResponse(
-            success=True, message=f"Library '{library_id}' deleted successfully"
-        )
-    except C7Error:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to delete library: {str(e)}"
-        )
+    await run_in_threadpool(library_service.delete_library, library_id)
+    return ORJSONResponse(
+        {"success": True, "message": f"Library '{library_id}' deleted successfully"}
+    )
@@ -7,39 +7,84 @@ The sub-app uses the default ``streamable_http_path="/mcp"`` so the MCP
 endpoint lives at ``/mcp`` inside the sub-app.  The parent FastAPI app
 mounts the sub-app at ``"/"`` (after its own routes) so that
 ``POST /mcp`` reaches this handler without a trailing-slash redirect.
+
+FastMCP calls synchronous tools directly on the event loop, so the tools
+are async and hand the blocking service calls to the worker thread pool.
+
+Sessions live in the memory of the process that created them. With
+several server workers, set ``C7_MCP_STATELESS=1`` (``c7-mcp serve`` does
+this when ``--workers`` > 1) so any worker can answer any request; the
+tools keep no per-session state.
 """
 
-from mcp.server.fastmcp import FastMCP
+import os
+from typing import Annotated, Any
 
+from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool as MCPTool
+from pydantic import Field
+from starlette.concurrency import run_in_threadpool
+
+from c7_mcp.exceptions import C7Error
+from c7_mcp.schemas.document import DocumentFetch, DocumentFetchResult, DocumentResponse
+from c7_mcp.services import document as document_service
+from c7_mcp.services import library as library_service
 from c7_mcp.services import mcp as mcp_service
 
-mcp_server = FastMCP("simple-c7-mcp")
+
+class CachedToolsFastMCP(FastMCP):
+    """FastMCP server that builds the ``tools/list`` result once.
+
+    FastMCP rebuilds every ``Tool`` model (name, description, JSON schemas)
+    on each ``tools/list`` request. The registered tools only change when
+    ``add_tool`` is called, so the result is cached until then. The cache
+    is a tuple so callers cannot mutate it through the returned list.
+    """
+
+    _tools_cache: tuple[MCPTool, ...] | None = None
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        """Register a tool and drop the cached tool list."""
+        super().add_tool(*args, **kwargs)
+        self._tools_cache = None
+
+    async def list_tools(self) -> list[MCPTool]:
+        """List all available tools, reusing the cached result."""
+        if self._tools_cache is None:
+            self._tools_cache = tuple(await super().list_tools())
+        return list(self._tools_cache)
+
+
+# Stateless mode: no Mcp-Session-Id, each request is handled on its own
+MCP_STATELESS = os.getenv("C7_MCP_STATELESS", "0").lower() in ("1", "true", "yes")
+
+mcp_server = CachedToolsFastMCP("simple-c7-mcp", stateless_http=MCP_STATELESS)
 
 
 @mcp_server.tool(name="resolve-library-id")
-def resolve_library_id(libraryName: str, query: str) -> str:  # noqa: N803
+async def resolve_library_id(libraryName: str, query: str) -> str:  # noqa: N803
     """Resolve library name to Context7-compatible ID.
 
     Args:
         libraryName: Name of the library (e.g., "React", "FastAPI").
         query: User's query for context.
     """
-    return mcp_service.resolve_library_id(libraryName, query)
+    return await run_in_threadpool(mcp_service.resolve_library_id, libraryName, query)
 
 
 @mcp_server.tool(name="query-docs")
-def query_docs(libraryId: str, query: str) -> str:  # noqa: N803
+async def query_docs(libraryId: str, query: str) -> str:  # noqa: N803
     """Query documentation by library ID.
 
     Args:
         libraryId: Context7-compatible library identifier.
         query: Documentation query string.
     """
-    return mcp_service.query_docs(libraryId, query)
+    return await run_in_threadpool(mcp_service.query_docs, libraryId, query)
 
 
 @mcp_server.tool(name="fetch-library-docs")
-def fetch_library_docs(
+async def fetch_library_docs(
     libraryName: str,  # noqa: N803
     query: str = "",
     fetchIfMissing: bool = False,  # noqa: N803
@@ -51,7 +96,40 @@ def fetch_library_docs(
         query: Extra context to disambiguate remote resolution.
         fetchIfMissing: Explicit opt-in to fetch from Context7 if missing.
     """
-    return mcp_service.fetch_library_docs(libraryName, query, fetchIfMissing)
+    return await run_in_threadpool(
+        mcp_service.fetch_library_docs, libraryName, query, fetchIfMissing
+    )
+
+
+@mcp_server.tool(name="fetch-library-docs-bulk")
+async def fetch_library_docs_bulk(
+    documents: Annotated[list[DocumentFetch], Field(min_length=1, max_length=100)],
+) -> list[DocumentFetchResult]:
+    """Fetch many URLs concurrently and store each as a document.
+
+    Items succeed or fail independently, as with
+    ``POST /api/v1/documents/fetch/bulk``.
+
+    Args:
+        documents: Up to 100 items, each with title, url and library_id.
+    """
+    results = await run_in_threadpool(
+        document_service.fetch_documents_bulk,
+        [(doc.title, str(doc.url), doc.library_id) for doc in documents],
+    )
+    touched = {
+        result["library_id"] for result in results if not isinstance(result, C7Error)
+    }
+    if touched:
+        await run_in_threadpool(library_service.refresh_document_counts, touched)
+    return [
+        DocumentFetchResult(url=str(doc.url), error=result.message)
+        if isinstance(result, C7Error)
+        else DocumentFetchResult(
+            url=str(doc.url), document=DocumentResponse.model_validate(result)
+        )
+        for doc, result in zip(documents, results, strict=True)
+    ]
 
 
 mcp_app = mcp_server.streamable_http_app()
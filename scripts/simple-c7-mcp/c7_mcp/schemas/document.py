@@ -2,6 +2,12 @@
 
 This module defines schemas for document CRUD operations, including
 content upload, URL fetching, and various update operations.
+
+Request models validate untrusted input. Response models (e.g.
+DocumentResponse) only describe the API in OpenAPI: the router renders
+service results directly, since the service layer builds them from its
+own rows. Build instances with ``model_construct`` if one is ever needed
+for trusted data.
 """
 
 from datetime import datetime
@@ -113,6 +119,20 @@ class DocumentResponse(BaseModel):
     has_embeddings: bool = Field(default=False)
 
 
+class DocumentFetchResult(BaseModel):
+    """Schema for one item of a bulk URL fetch.
+
+    Attributes:
+        url: URL that was requested.
+        document: Created document metadata (None if the item failed).
+        error: Failure message (None if the document was created).
+    """
+
+    url: str
+    document: DocumentResponse | None = None
+    error: str | None = None
+
+
 class DocumentContent(BaseModel):
     """Schema for document content response (raw text).
 
@@ -4,17 +4,75 @@ This module provides business logic for document CRUD operations,
 including content management and embeddings.
 """
 
+import hashlib
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import PurePosixPath
 from typing import TypedDict
+from urllib.parse import urlsplit
 
+import httpx
+import numpy as np
+import orjson
+
+from c7_mcp.cache import CacheStats, TTLCache
+from c7_mcp.db import get_documents_table, where_eq
 from c7_mcp.exceptions import (
     C7Error,
     DocumentNotFoundError,
     EmbeddingDimensionError,
     EmbeddingsNotFoundError,
+    LibrariesNotFoundError,
     LibraryNotFoundError,
     URLFetchError,
 )
+from c7_mcp.http_client import get_http_client
+from c7_mcp.models import Document
+from c7_mcp.services import library as library_service
+
+# Content-Type substrings that name a source type, checked in order
+_CONTENT_TYPE_MARKERS = ("html", "json")
+# Source types inferred from the URL path when Content-Type is not decisive
+_SOURCE_TYPE_BY_SUFFIX = {".md": "markdown", ".rst": "rst"}
+
+# Largest response body _fetch_url will download
+MAX_FETCH_BYTES = int(os.getenv("C7_MAX_FETCH_BYTES", str(10 * 1024 * 1024)))
+
+# Simultaneous URL downloads for bulk fetches, shared by all requests so
+# concurrent bulk calls cannot multiply the thread count
+FETCH_CONCURRENCY = 16
+_fetch_pool = ThreadPoolExecutor(
+    max_workers=FETCH_CONCURRENCY, thread_name_prefix="c7-fetch"
+)
+
+# list_documents pages keyed by (library_id, limit, offset, table version)
+_list_cache = TTLCache(maxsize=256, ttl=60.0)
+# get_document results keyed by (doc_id, table version)
+_document_cache = TTLCache(maxsize=1024, ttl=60.0)
+
+# Length of the document vector column, from the table schema
+EMBEDDING_DIM: int = Document.to_arrow_schema().field("vector").type.list_size
+
+# Placeholder stored until real embeddings are uploaded: LanceDB requires
+# the vector column, and one shared read-only array avoids building a
+# 2560-element list per row
+_ZERO_VECTOR = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+_ZERO_VECTOR.flags.writeable = False
+
+# metadata_json of a document whose vector is still the placeholder
+_NO_EMBEDDINGS_METADATA = orjson.dumps({"has_real_embeddings": False}).decode()
+
+# Columns _row_to_document reads; selecting them skips the 2560-d vector
+_DOCUMENT_COLUMNS = [
+    "document_id",
+    "title",
+    "library_id",
+    "text",
+    "created_at",
+    "metadata_json",
+]
 
 
 class DocumentData(TypedDict):
@@ -43,16 +101,84 @@ class EmbeddingData(TypedDict):
     """Embedding data structure.
 
     Attributes:
-        embeddings: List of embedding values.
+        embeddings: Embedding values as a float32 array.
         dimension: Embedding dimension.
         model: Model used to generate embeddings.
     """
 
-    embeddings: list[float]
+    embeddings: np.ndarray
     dimension: int
     model: str | None
 
 
+def _chunk_id(document_id: str, chunk_index: int = 0) -> int:
+    """Derive the numeric chunk ID stored in the ``id`` column.
+
+    The ID is a 63-bit BLAKE2b digest of the document ID and chunk index,
+    so it fits the int64 column, is the same in every process (unlike
+    ``hash()``, which is salted per process), and rewrites of a chunk
+    keep their ID.
+
+    Args:
+        document_id: Document the chunk belongs to.
+        chunk_index: Position of the chunk in the document.
+
+    Returns:
+        Non-negative chunk ID.
+    """
+    digest = hashlib.blake2b(
+        f"{document_id}:{chunk_index}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest) >> 1
+
+
+def _row_to_document(row: dict, updated_at: datetime | None = None) -> DocumentData:
+    """Build DocumentData from a documents-table row.
+
+    Write paths pass the row they just stored, so the response reflects
+    exactly what was written without reading it back.
+
+    Args:
+        row: Chunk row as stored in (or read from) the documents table.
+        updated_at: Last update timestamp (defaults to the row's created_at).
+
+    Returns:
+        Document data with metadata and content.
+    """
+    metadata = orjson.loads(row.get("metadata_json", "{}"))
+    return {
+        "id": row["document_id"],
+        "title": row["title"],
+        "library_id": row["library_id"],
+        "content": row["text"],
+        "created_at": row["created_at"],
+        "updated_at": updated_at or row["created_at"],
+        "has_embeddings": metadata.get("has_real_embeddings", False),
+    }
+
+
+def _replace_document(documents, row: dict) -> None:
+    """Replace every stored chunk of a document with a single new row.
+
+    Runs as one ``merge_insert`` keyed on the chunk ID, so the rewrite
+    is atomic (readers never see the document missing) and creates one
+    table version instead of two. Chunks of the document that the new
+    row does not match, such as rows written with an older ID scheme,
+    are deleted in the same operation.
+
+    Args:
+        documents: Documents table.
+        row: Complete row for chunk 0 of the document.
+    """
+    (
+        documents.merge_insert("id")
+        .when_matched_update_all()
+        .when_not_matched_insert_all()
+        .when_not_matched_by_source_delete(where_eq("document_id", row["document_id"]))
+        .execute([row])
+    )
+
+
 def list_documents(
     library_id: str | None = None, limit: int = 100, offset: int = 0
 ) -> list[DocumentData]:
@@ -66,43 +192,32 @@ def list_documents(
     Returns:
         List of documents with metadata.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table
-
     documents = get_documents_table()
 
-    # Query documents with optional library filter
+    # Any write bumps the table version, so a hit is never stale
+    cache_key = (library_id, limit, offset, documents.version)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    # One row per document: every document has exactly one chunk 0, so
+    # filtering on it replaces de-duplication and lets LanceDB apply
+    # limit/offset to documents rather than chunks
+    where = "chunk_index = 0"
     if library_id:
-        results = (
-            documents.search()
-            .where(f"library_id = '{library_id}'", prefilter=True)
-            .limit(limit)
-            .to_list()
-        )
-    else:
-        results = documents.search().limit(limit).to_list()
-
-    # Group chunks by document_id and return unique documents
-    seen_docs = {}
-    for chunk in results:
-        doc_id = chunk["document_id"]
-        if doc_id not in seen_docs:
-            # Check metadata for real embeddings flag
-            metadata = json.loads(chunk.get("metadata_json", "{}"))
-            has_embeddings = metadata.get("has_real_embeddings", False)
-
-            seen_docs[doc_id] = {
-                "id": doc_id,
-                "title": chunk["title"],
-                "library_id": chunk["library_id"],
-                "content": chunk["text"],  # Use first chunk's text as content
-                "created_at": chunk["created_at"],
-                "updated_at": chunk["created_at"],  # No separate updated_at yet
-                "has_embeddings": has_embeddings,
-            }
-
-    return list(seen_docs.values())[offset : offset + limit]
+        where += f" AND {where_eq('library_id', library_id)}"
+    results = (
+        documents.search()
+        .where(where, prefilter=True)
+        .select(_DOCUMENT_COLUMNS)
+        .offset(offset)
+        .limit(limit)
+        .to_list()
+    )
+
+    page = [_row_to_document(chunk) for chunk in results]
+    _list_cache.set(cache_key, page)
+    return list(page)
 
 
 def create_document(title: str, content: str, library_id: str) -> DocumentData:
@@ -119,72 +234,191 @@ def create_document(title: str, content: str, library_id: str) -> DocumentData:
     Raises:
         ValueError: If library not found.
     """
-    import json
-    import uuid
+    try:
+        return create_documents([(title, content, library_id)])[0]
+    except LibrariesNotFoundError:
+        # Keep the single-item error (and its slug) for the one library
+        raise LibraryNotFoundError(library_id) from None
 
-    from c7_mcp.db import get_documents_table, get_libraries_table
 
-    libraries = get_libraries_table()
-    documents = get_documents_table()
-    now = datetime.now()
+def create_documents(items: list[tuple[str, str, str]]) -> list[DocumentData]:
+    """Create many documents from uploaded content in one write.
 
-    # 1. Verify library exists
-    existing_lib = (
-        libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
-        .limit(1)
-        .to_list()
+    Libraries are looked up in one query and all documents are stored
+    with a single ``add`` (one new table version). Nothing is written
+    unless every referenced library exists.
+
+    Args:
+        items: (title, content, library_id) tuples.
+
+    Returns:
+        Created documents, in input order.
+
+    Raises:
+        LibrariesNotFoundError: If any referenced library does not exist
+            (lists every missing one, in input order).
+    """
+    if not items:
+        return []
+
+    libraries = library_service.get_library_rows(
+        {library_id for _, _, library_id in items}
     )
+    missing = [
+        library_id
+        for library_id in dict.fromkeys(library_id for _, _, library_id in items)
+        if library_id not in libraries
+    ]
+    if missing:
+        raise LibrariesNotFoundError(missing)
+
+    # Each document is a single chunk with a placeholder zero vector;
+    # embeddings are uploaded later. Library document_count is refreshed
+    # by the router in a background task.
+    now = datetime.now()
+    rows = [
+        _new_row(title, "uploaded", libraries[library_id], content, "text", now)
+        for title, content, library_id in items
+    ]
+    get_documents_table().add(rows)
 
-    if not existing_lib:
-        raise LibraryNotFoundError(library_id)
+    return [_row_to_document(row) for row in rows]
 
-    library = existing_lib[0]
 
-    # 2. Generate unique document ID
-    document_id = f"doc-{uuid.uuid4()}"
+def _fetch_url(url: str) -> tuple[str, str]:
+    """Download a URL and detect its source type.
+
+    Args:
+        url: URL to fetch content from.
+
+    Returns:
+        Tuple of (decoded content, source_type).
+
+    Raises:
+        URLFetchError: If the request fails, returns an error status, or
+            the body is larger than ``MAX_FETCH_BYTES``.
+    """
+    try:
+        # Stream the body so an oversized response is rejected as soon as
+        # it crosses the limit rather than after it is fully buffered
+        with get_http_client().stream("GET", url) as response:
+            response.raise_for_status()
+            if int(response.headers.get("Content-Length", 0)) > MAX_FETCH_BYTES:
+                raise URLFetchError(url, f"Response exceeds {MAX_FETCH_BYTES} bytes")
+            body = bytearray()
+            for chunk in response.iter_bytes():
+                body += chunk
+                if len(body) > MAX_FETCH_BYTES:
+                    raise URLFetchError(
+                        url, f"Response exceeds {MAX_FETCH_BYTES} bytes"
+                    )
+            content_type = response.headers.get("Content-Type", "")
+        content = body.decode("utf-8", errors="replace")
+    except httpx.HTTPStatusError as e:
+        code, reason = e.response.status_code, e.response.reason_phrase
+        raise URLFetchError(url, f"HTTP Error {code}: {reason}")
+    except C7Error:
+        raise
+    except Exception as e:
+        raise URLFetchError(url, str(e))
 
-    # 3. Store content as a single chunk without real embeddings
-    # We use a zero vector as placeholder since embeddings will be generated later
-    # LanceDB requires vectors to exist, so we create a dummy 2560-dim zero vector
-    zero_vector = [0.0] * 2560
+    return content, _detect_source_type(url, content_type)
+
+
+def _detect_source_type(url: str, content_type: str) -> str:
+    """Detect a document's source type from its Content-Type or URL.
+
+    Args:
+        url: URL the content was fetched from.
+        content_type: Response Content-Type header (may be empty).
 
-    document_data = {
-        "id": hash(document_id) & 0x7FFFFFFF,  # Convert to positive int
+    Returns:
+        One of ``"html"``, ``"json"``, ``"markdown"``, ``"rst"`` or ``"text"``.
+
+    Example:
+        >>> _detect_source_type("https://example.com/README.md?raw=1", "")
+        'markdown'
+    """
+    for marker in _CONTENT_TYPE_MARKERS:
+        if marker in content_type:
+            return marker
+    suffix = PurePosixPath(urlsplit(url).path).suffix.lower()
+    return _SOURCE_TYPE_BY_SUFFIX.get(suffix, "text")
+
+
+def _new_row(
+    title: str,
+    source: str,
+    library: dict,
+    content: str,
+    source_type: str,
+    now: datetime,
+) -> dict:
+    """Build a documents-table row for a new single-chunk document.
+
+    Args:
+        title: Document title.
+        source: URL the content was fetched from, or ``"uploaded"``.
+        library: Libraries-table row the document belongs to.
+        content: Document content.
+        source_type: Detected source type (``"text"`` for uploads).
+        now: Creation timestamp.
+
+    Returns:
+        Row ready for ``documents.add``.
+    """
+    document_id = f"doc-{uuid.uuid4()}"
+    return {
+        "id": _chunk_id(document_id),
         "document_id": document_id,
-        "library_id": library_id,
+        "library_id": library["id"],
         "title": title,
         "text": content,
         "chunk_index": 0,
         "chunk_total": 1,
-        "source": "uploaded",
-        "source_type": "text",
-        "vector": zero_vector,
-        "metadata_json": json.dumps({"has_real_embeddings": False}),
+        "source": source,
+        "source_type": source_type,
+        "vector": _ZERO_VECTOR,
+        "metadata_json": _NO_EMBEDDINGS_METADATA,
         "created_at": now,
         "library_name": library["name"],
         "library_language": library["language"],
         "library_ecosystem": library["ecosystem"],
     }
 
-    # 4. Store in database
-    documents.add([document_data])
 
-    # 5. Update library document count
-    # Note: LanceDB doesn't support UPDATE, so we need to delete and re-add
-    # For now, we skip this and handle it in a future enhancement
-    # TODO: Implement document count updates
+def _replacement_row(existing: dict, **changes) -> dict:
+    """Build the single chunk-0 row that replaces a stored document.
 
-    # 6. Return DocumentData TypedDict
-    return {
-        "id": document_id,
-        "title": title,
-        "library_id": library_id,
-        "content": content,
-        "created_at": now,
-        "updated_at": now,
-        "has_embeddings": False,
+    Args:
+        existing: A stored chunk of the document; unchanged fields
+            (including ``created_at``) are copied from it.
+        **changes: Column values to set.
+
+    Returns:
+        Row ready for :func:`_replace_document`.
+    """
+    # Keys follow the table's column order: merge_insert infers the
+    # source schema from the row and rejects one that differs
+    row = {
+        "id": _chunk_id(existing["document_id"]),
+        "document_id": existing["document_id"],
+        "library_id": existing["library_id"],
+        "title": existing["title"],
+        "text": existing["text"],
+        "chunk_index": 0,
+        "chunk_total": 1,
+        "source": existing["source"],
+        "source_type": existing["source_type"],
+        "vector": existing.get("vector"),
+        "metadata_json": existing["metadata_json"],
+        "created_at": existing["created_at"],
+        "library_name": existing["library_name"],
+        "library_language": existing["library_language"],
+        "library_ecosystem": existing["library_ecosystem"],
     }
+    row.update(changes)
+    return row
 
 
 def fetch_document(title: str, url: str, library_id: str) -> DocumentData:
@@ -201,84 +435,78 @@ def fetch_document(title: str, url: str, library_id: str) -> DocumentData:
     Raises:
         ValueError: If library not found or URL fetch fails.
     """
-    import json
-    import urllib.request
-    import uuid
-
-    from c7_mcp.db import get_documents_table, get_libraries_table
-
-    libraries = get_libraries_table()
     documents = get_documents_table()
     now = datetime.now()
 
     # 1. Verify library exists
-    existing_lib = (
-        libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
-        .limit(1)
-        .to_list()
-    )
-    if not existing_lib:
+    library = library_service.get_library_rows({library_id}).get(library_id)
+    if library is None:
         raise LibraryNotFoundError(library_id)
 
-    library = existing_lib[0]
-
     # 2. Fetch content from URL
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "c7-mcp/1.0"})
-        with urllib.request.urlopen(req, timeout=30) as response:
-            content = response.read().decode("utf-8", errors="replace")
-            content_type = response.headers.get("Content-Type", "")
-    except C7Error:
-        raise
-    except Exception as e:
-        raise URLFetchError(url, str(e))
+    content, source_type = _fetch_url(url)
 
-    # 3. Determine source_type from Content-Type or URL extension
-    if "html" in content_type:
-        source_type = "html"
-    elif "json" in content_type:
-        source_type = "json"
-    elif url.endswith(".md"):
-        source_type = "markdown"
-    elif url.endswith(".rst"):
-        source_type = "rst"
-    else:
-        source_type = "text"
-
-    # 4. Generate unique document ID and store
-    document_id = f"doc-{uuid.uuid4()}"
-    zero_vector = [0.0] * 2560
+    # 3. Generate unique document ID and store
+    document_data = _new_row(title, url, library, content, source_type, now)
+    documents.add([document_data])
 
-    document_data = {
-        "id": hash(document_id) & 0x7FFFFFFF,
-        "document_id": document_id,
-        "library_id": library_id,
-        "title": title,
-        "text": content,
-        "chunk_index": 0,
-        "chunk_total": 1,
-        "source": url,
-        "source_type": source_type,
-        "vector": zero_vector,
-        "metadata_json": json.dumps({"has_real_embeddings": False}),
-        "created_at": now,
-        "library_name": library["name"],
-        "library_language": library["language"],
-        "library_ecosystem": library["ecosystem"],
-    }
+    return _row_to_document(document_data)
 
-    documents.add([document_data])
 
-    return {
-        "id": document_id,
-        "title": title,
-        "library_id": library_id,
-        "content": content,
-        "created_at": now,
-        "updated_at": now,
-        "has_embeddings": False,
-    }
+def fetch_documents_bulk(
+    items: list[tuple[str, str, str]],
+) -> list[DocumentData | C7Error]:
+    """Create documents from many URLs, downloading them concurrently.
+
+    Libraries are looked up in one query, URLs are fetched on the shared
+    fetch pool (at most ``FETCH_CONCURRENCY`` at a time across all
+    callers), and all fetched documents are stored with a single ``add``
+    (one new table version). A failed item does not affect the others.
+
+    Args:
+        items: (title, url, library_id) tuples.
+
+    Returns:
+        One entry per item, in input order: the created document, or the
+        error (library not found, URL fetch failure) that prevented it.
+    """
+    if not items:
+        return []
+
+    # 1. Look up every referenced library at once
+    libraries = library_service.get_library_rows(
+        {library_id for _, _, library_id in items}
+    )
+
+    def fetch(item: tuple[str, str, str]) -> tuple[str, str] | C7Error:
+        _, url, library_id = item
+        if library_id not in libraries:
+            return LibraryNotFoundError(library_id)
+        try:
+            return _fetch_url(url)
+        except C7Error as e:
+            return e
+
+    # 2. Fetch URLs concurrently (network-bound, so threads overlap waits)
+    outcomes = list(_fetch_pool.map(fetch, items))
+
+    # 3. Store every successful fetch in one write
+    now = datetime.now()
+    rows = []
+    results: list[DocumentData | C7Error] = []
+    for (title, url, library_id), outcome in zip(items, outcomes, strict=True):
+        if isinstance(outcome, C7Error):
+            results.append(outcome)
+            continue
+        content, source_type = outcome
+        row = _new_row(title, url, libraries[library_id], content, source_type, now)
+        rows.append(row)
+        results.append(_row_to_document(row))
+
+    if rows:
+        get_documents_table().add(rows)
+
+    return results
 
 
 def get_document(doc_id: str) -> DocumentData:
@@ -293,29 +521,37 @@ def get_document(doc_id: str) -> DocumentData:
     Raises:
         ValueError: If document not found.
     """
-    import json
+    documents = get_documents_table()
 
-    from c7_mcp.db import get_documents_table
+    cache_key = (doc_id, documents.version)
+    cached = _document_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
 
-    documents = get_documents_table()
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
+        .where(where_eq("document_id", doc_id), prefilter=True)
+        .select(_DOCUMENT_COLUMNS)
         .limit(1)
         .to_list()
     )
     if not results:
         raise DocumentNotFoundError(doc_id)
-    chunk = results[0]
-    metadata = json.loads(chunk.get("metadata_json", "{}"))
+
+    document = _row_to_document(results[0])
+    _document_cache.set(cache_key, document)
+    return dict(document)
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Get counters for the document read caches.
+
+    Returns:
+        Stats for the list_documents and get_document caches.
+    """
     return {
-        "id": doc_id,
-        "title": chunk["title"],
-        "library_id": chunk["library_id"],
-        "content": chunk["text"],
-        "created_at": chunk["created_at"],
-        "updated_at": chunk["created_at"],
-        "has_embeddings": metadata.get("has_real_embeddings", False),
+        "list_documents": _list_cache.stats(),
+        "get_document": _document_cache.stats(),
     }
 
 
@@ -346,27 +582,25 @@ def get_embeddings(doc_id: str) -> EmbeddingData:
     Raises:
         ValueError: If document not found or has no embeddings.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table
-
     documents = get_documents_table()
-    results = (
+    result = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
+        .where(where_eq("document_id", doc_id), prefilter=True)
+        .select(["vector", "metadata_json"])
         .limit(1)
-        .to_list()
+        .to_arrow()
     )
-    if not results:
+    if result.num_rows == 0:
         raise DocumentNotFoundError(doc_id)
 
-    chunk = results[0]
-    metadata = json.loads(chunk.get("metadata_json", "{}"))
+    metadata = orjson.loads(result.column("metadata_json")[0].as_py() or "{}")
 
     if not metadata.get("has_real_embeddings", False):
         raise EmbeddingsNotFoundError(doc_id)
 
-    vector = chunk.get("vector", [])
+    # Read the fixed-size float32 list straight into numpy instead of
+    # boxing every value as a Python float
+    vector = result.column("vector").combine_chunks().flatten().to_numpy()
     return {
         "embeddings": vector,
         "dimension": len(vector),
@@ -377,7 +611,7 @@ def get_embeddings(doc_id: str) -> EmbeddingData:
 def update_content(doc_id: str, content: str) -> DocumentData:
     """Update document content.
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
+    The stored row is rewritten in place with ``merge_insert``.
 
     Args:
         doc_id: Document unique identifier.
@@ -389,69 +623,38 @@ def update_content(doc_id: str, content: str) -> DocumentData:
     Raises:
         ValueError: If document not found.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table
-
     documents = get_documents_table()
     now = datetime.now()
 
     # 1. Query all chunks for this document
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
+        .where(where_eq("document_id", doc_id), prefilter=True)
         .limit(1000)
         .to_list()
     )
     if not results:
         raise DocumentNotFoundError(doc_id)
 
-    # 2. Preserve metadata from first chunk
-    first_chunk = results[0]
-    original_created_at = first_chunk["created_at"]
-
-    # 3. Delete all existing chunks
-    documents.delete(f"document_id = '{doc_id}'")
-
-    # 4. Re-add single chunk with new content
-    zero_vector = [0.0] * 2560
-    document_data = {
-        "id": hash(doc_id) & 0x7FFFFFFF,
-        "document_id": doc_id,
-        "library_id": first_chunk["library_id"],
-        "title": first_chunk["title"],
-        "text": content,
-        "chunk_index": 0,
-        "chunk_total": 1,
-        "source": first_chunk["source"],
-        "source_type": first_chunk["source_type"],
-        "vector": zero_vector,
-        "metadata_json": json.dumps({"has_real_embeddings": False}),
-        "created_at": original_created_at,
-        "library_name": first_chunk["library_name"],
-        "library_language": first_chunk["library_language"],
-        "library_ecosystem": first_chunk["library_ecosystem"],
-    }
+    # 2. Replace all chunks with a single chunk holding the new content
+    document_data = _replacement_row(
+        results[0],
+        text=content,
+        vector=_ZERO_VECTOR,
+        metadata_json=_NO_EMBEDDINGS_METADATA,
+    )
 
-    documents.add([document_data])
+    _replace_document(documents, document_data)
 
-    return {
-        "id": doc_id,
-        "title": first_chunk["title"],
-        "library_id": first_chunk["library_id"],
-        "content": content,
-        "created_at": original_created_at,
-        "updated_at": now,
-        "has_embeddings": False,
-    }
+    return _row_to_document(document_data, updated_at=now)
 
 
 def full_update_document(
     doc_id: str, title: str, content: str, library_id: str
-) -> DocumentData:
+) -> tuple[DocumentData, str]:
     """Full document update (title, content, and library).
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
+    The stored row is rewritten in place with ``merge_insert``.
     Invalidates embeddings since content changes.
 
     Args:
@@ -461,84 +664,53 @@ def full_update_document(
         library_id: Target library ID.
 
     Returns:
-        Updated document data.
+        Tuple of (updated document data, library ID the document was in
+        before the update).
 
     Raises:
         ValueError: If document or target library not found.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table, get_libraries_table
-
     documents = get_documents_table()
     now = datetime.now()
 
     # 1. Verify document exists
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
+        .where(where_eq("document_id", doc_id), prefilter=True)
         .limit(1000)
         .to_list()
     )
     if not results:
         raise DocumentNotFoundError(doc_id)
 
-    first_chunk = results[0]
-    original_created_at = first_chunk["created_at"]
-
-    # 2. Verify target library exists
-    libraries = get_libraries_table()
-    lib_results = (
-        libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
-        .limit(1)
-        .to_list()
-    )
-    if not lib_results:
+    # 2. Verify target library exists (usually served from the cache)
+    library = library_service.get_library_rows({library_id}).get(library_id)
+    if library is None:
         raise LibraryNotFoundError(library_id)
 
-    library = lib_results[0]
-
-    # 3. Delete all existing chunks
-    documents.delete(f"document_id = '{doc_id}'")
-
-    # 4. Re-add with all new values
-    zero_vector = [0.0] * 2560
-    document_data = {
-        "id": hash(doc_id) & 0x7FFFFFFF,
-        "document_id": doc_id,
-        "library_id": library_id,
-        "title": title,
-        "text": content,
-        "chunk_index": 0,
-        "chunk_total": 1,
-        "source": first_chunk["source"],
-        "source_type": first_chunk["source_type"],
-        "vector": zero_vector,
-        "metadata_json": json.dumps({"has_real_embeddings": False}),
-        "created_at": original_created_at,
-        "library_name": library["name"],
-        "library_language": library["language"],
-        "library_ecosystem": library["ecosystem"],
-    }
+    # 3. Replace all chunks with the new values
+    document_data = _replacement_row(
+        results[0],
+        library_id=library_id,
+        title=title,
+        text=content,
+        vector=_ZERO_VECTOR,
+        metadata_json=_NO_EMBEDDINGS_METADATA,
+        library_name=library["name"],
+        library_language=library["language"],
+        library_ecosystem=library["ecosystem"],
+    )
 
-    documents.add([document_data])
+    _replace_document(documents, document_data)
 
-    return {
-        "id": doc_id,
-        "title": title,
-        "library_id": library_id,
-        "content": content,
-        "created_at": original_created_at,
-        "updated_at": now,
-        "has_embeddings": False,
-    }
+    return _row_to_document(document_data, updated_at=now), results[0]["library_id"]
 
 
 def update_title(doc_id: str, title: str) -> DocumentData:
     """Update document title.
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
+    Only the title column is updated; the vector and text are neither
+    read nor written back.
 
     Args:
         doc_id: Document unique identifier.
@@ -550,154 +722,88 @@ def update_title(doc_id: str, title: str) -> DocumentData:
     Raises:
         ValueError: If document not found.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table
-
     documents = get_documents_table()
     now = datetime.now()
 
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
-        .limit(1000)
+        .where(where_eq("document_id", doc_id), prefilter=True)
+        .select(_DOCUMENT_COLUMNS)
+        .limit(1)
         .to_list()
     )
     if not results:
         raise DocumentNotFoundError(doc_id)
 
-    first_chunk = results[0]
-    original_created_at = first_chunk["created_at"]
-    metadata = json.loads(first_chunk.get("metadata_json", "{}"))
-    has_embeddings = metadata.get("has_real_embeddings", False)
-
-    documents.delete(f"document_id = '{doc_id}'")
+    documents.update(where=where_eq("document_id", doc_id), values={"title": title})
 
-    document_data = {
-        "id": hash(doc_id) & 0x7FFFFFFF,
-        "document_id": doc_id,
-        "library_id": first_chunk["library_id"],
-        "title": title,
-        "text": first_chunk["text"],
-        "chunk_index": 0,
-        "chunk_total": 1,
-        "source": first_chunk["source"],
-        "source_type": first_chunk["source_type"],
-        "vector": first_chunk["vector"],
-        "metadata_json": first_chunk["metadata_json"],
-        "created_at": original_created_at,
-        "library_name": first_chunk["library_name"],
-        "library_language": first_chunk["library_language"],
-        "library_ecosystem": first_chunk["library_ecosystem"],
-    }
+    return _row_to_document({**results[0], "title": title}, updated_at=now)
 
-    documents.add([document_data])
 
-    return {
-        "id": doc_id,
-        "title": title,
-        "library_id": first_chunk["library_id"],
-        "content": first_chunk["text"],
-        "created_at": original_created_at,
-        "updated_at": now,
-        "has_embeddings": has_embeddings,
-    }
-
-
-def update_library(doc_id: str, library_id: str) -> DocumentData:
+def update_library(doc_id: str, library_id: str) -> tuple[DocumentData, str]:
     """Move document to a different library.
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
+    Only the library columns are updated; the vector and text are
+    neither read nor written back.
 
     Args:
         doc_id: Document unique identifier.
         library_id: Target library ID.
 
     Returns:
-        Updated document data.
+        Tuple of (updated document data, library ID the document was in
+        before the move).
 
     Raises:
         ValueError: If document or target library not found.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table, get_libraries_table
-
     documents = get_documents_table()
     now = datetime.now()
 
     # 1. Verify document exists
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
-        .limit(1000)
+        .where(where_eq("document_id", doc_id), prefilter=True)
+        .select(_DOCUMENT_COLUMNS)
+        .limit(1)
         .to_list()
     )
     if not results:
         raise DocumentNotFoundError(doc_id)
 
-    first_chunk = results[0]
-    original_created_at = first_chunk["created_at"]
-    metadata = json.loads(first_chunk.get("metadata_json", "{}"))
-    has_embeddings = metadata.get("has_real_embeddings", False)
-
-    # 2. Verify target library exists
-    libraries = get_libraries_table()
-    lib_results = (
-        libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
-        .limit(1)
-        .to_list()
-    )
-    if not lib_results:
+    # 2. Verify target library exists (usually served from the cache)
+    library = library_service.get_library_rows({library_id}).get(library_id)
+    if library is None:
         raise LibraryNotFoundError(library_id)
 
-    library = lib_results[0]
-
-    # 3. Delete and re-add with new library
-    documents.delete(f"document_id = '{doc_id}'")
-
-    document_data = {
-        "id": hash(doc_id) & 0x7FFFFFFF,
-        "document_id": doc_id,
-        "library_id": library_id,
-        "title": first_chunk["title"],
-        "text": first_chunk["text"],
-        "chunk_index": 0,
-        "chunk_total": 1,
-        "source": first_chunk["source"],
-        "source_type": first_chunk["source_type"],
-        "vector": first_chunk["vector"],
-        "metadata_json": first_chunk["metadata_json"],
-        "created_at": original_created_at,
-        "library_name": library["name"],
-        "library_language": library["language"],
-        "library_ecosystem": library["ecosystem"],
-    }
-
-    documents.add([document_data])
+    # 3. Point every chunk at the new library
+    documents.update(
+        where=where_eq("document_id", doc_id),
+        values={
+            "library_id": library_id,
+            "library_name": library["name"],
+            "library_language": library["language"],
+            "library_ecosystem": library["ecosystem"],
+        },
+    )
 
-    return {
-        "id": doc_id,
-        "title": first_chunk["title"],
-        "library_id": library_id,
-        "content": first_chunk["text"],
-        "created_at": original_created_at,
-        "updated_at": now,
-        "has_embeddings": has_embeddings,
-    }
+    previous = results[0]
+    return (
+        _row_to_document({**previous, "library_id": library_id}, updated_at=now),
+        previous["library_id"],
+    )
 
 
 def update_embeddings(
-    doc_id: str, embeddings: list[float], model: str | None = None
+    doc_id: str, embeddings: list[float] | np.ndarray, model: str | None = None
 ) -> DocumentData:
     """Update document embeddings.
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
+    The stored row is rewritten in place with ``merge_insert``.
 
     Args:
         doc_id: Document unique identifier.
-        embeddings: New embedding values.
+        embeddings: New embedding values (list or float32 array).
         model: Model used to generate embeddings.
 
     Returns:
@@ -706,16 +812,12 @@ def update_embeddings(
     Raises:
         ValueError: If document not found or dimension mismatch.
     """
-    import json
-
-    from c7_mcp.db import get_documents_table
-
     documents = get_documents_table()
     now = datetime.now()
 
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
+        .where(where_eq("document_id", doc_id), prefilter=True)
         .limit(1000)
         .to_list()
     )
@@ -723,70 +825,50 @@ def update_embeddings(
         raise DocumentNotFoundError(doc_id)
 
     first_chunk = results[0]
-    original_created_at = first_chunk["created_at"]
+
+    # Convert once to a contiguous float32 buffer (no-op for float32 arrays)
+    vector = np.asarray(embeddings, dtype=np.float32).reshape(-1)
 
     # Validate dimension (must match configured vector size of 2560)
     expected_dim = len(first_chunk["vector"])
-    if len(embeddings) != expected_dim:
-        raise EmbeddingDimensionError(len(embeddings), expected_dim)
-
-    documents.delete(f"document_id = '{doc_id}'")
+    if vector.shape[0] != expected_dim:
+        raise EmbeddingDimensionError(vector.shape[0], expected_dim)
 
     metadata: dict[str, bool | str] = {"has_real_embeddings": True}
     if model:
         metadata["embedding_model"] = model
 
-    document_data = {
-        "id": hash(doc_id) & 0x7FFFFFFF,
-        "document_id": doc_id,
-        "library_id": first_chunk["library_id"],
-        "title": first_chunk["title"],
-        "text": first_chunk["text"],
-        "chunk_index": 0,
-        "chunk_total": 1,
-        "source": first_chunk["source"],
-        "source_type": first_chunk["source_type"],
-        "vector": embeddings,
-        "metadata_json": json.dumps(metadata),
-        "created_at": original_created_at,
-        "library_name": first_chunk["library_name"],
-        "library_language": first_chunk["library_language"],
-        "library_ecosystem": first_chunk["library_ecosystem"],
-    }
+    document_data = _replacement_row(
+        first_chunk, vector=vector, metadata_json=orjson.dumps(metadata).decode()
+    )
 
-    documents.add([document_data])
+    _replace_document(documents, document_data)
 
-    return {
-        "id": doc_id,
-        "title": first_chunk["title"],
-        "library_id": first_chunk["library_id"],
-        "content": first_chunk["text"],
-        "created_at": original_created_at,
-        "updated_at": now,
-        "has_embeddings": True,
-    }
+    return _row_to_document(document_data, updated_at=now)
 
 
-def delete_document(doc_id: str) -> bool:
+def delete_document(doc_id: str) -> str:
     """Delete a document and all its chunks.
 
     Args:
         doc_id: Document unique identifier.
 
     Returns:
-        True if deletion was successful.
+        ID of the library the document belonged to.
 
     Raises:
         ValueError: If document not found.
     """
-    from c7_mcp.db import get_documents_table
-
     documents = get_documents_table()
 
-    # Verify document exists
+    # delete() reports no row count (and commits a new version even when
+    # nothing matches), so existence is checked first; the one-column read
+    # also gives the caller the library whose count changes
+    doc_filter = where_eq("document_id", doc_id)
     results = (
         documents.search()
-        .where(f"document_id = '{doc_id}'", prefilter=True)
+        .where(doc_filter, prefilter=True)
+        .select(["library_id"])
         .limit(1)
         .to_list()
     )
@@ -794,6 +876,6 @@ def delete_document(doc_id: str) -> bool:
         raise DocumentNotFoundError(doc_id)
 
     # Delete all chunks for this document
-    documents.delete(f"document_id = '{doc_id}'")
+    documents.delete(doc_filter)
 
-    return True
+    return results[0]["library_id"]
@@ -4,10 +4,13 @@ This module provides business logic for library CRUD operations.
 """
 
 import uuid
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import TypedDict
 
-from c7_mcp.db import get_libraries_table
+from c7_mcp.cache import CacheStats, TTLCache
+from c7_mcp.db import get_documents_table, get_libraries_table, sql_string, where_eq
 from c7_mcp.exceptions import ConstraintError, LibraryExistsError, LibraryNotFoundError
 
 
@@ -57,6 +60,26 @@ class LibraryData(TypedDict):
     document_count: int
 
 
+# Library table columns returned by listings
+_LIBRARY_FIELDS = list(LibraryData.__annotations__)
+
+# Libraries-table rows keyed by (library_id, table version)
+_row_cache = TTLCache(maxsize=256, ttl=60.0)
+
+
+def _name_filter(name: str, ecosystem: str) -> str:
+    """Build a filter matching a library name within an ecosystem.
+
+    Args:
+        name: Library name.
+        ecosystem: Package ecosystem.
+
+    Returns:
+        SQL filter with both values escaped.
+    """
+    return f"{where_eq('name', name)} AND {where_eq('ecosystem', ecosystem)}"
+
+
 def list_libraries() -> list[LibraryData]:
     """List all libraries.
 
@@ -65,8 +88,8 @@ def list_libraries() -> list[LibraryData]:
     """
     libraries = get_libraries_table()
 
-    # Query all libraries
-    results = libraries.search().limit(1000).to_list()
+    # Query all libraries (uncapped, matching iter_libraries)
+    results = libraries.search().to_list()
 
     # Convert to LibraryData format
     library_list = []
@@ -96,6 +119,60 @@ def list_libraries() -> list[LibraryData]:
     return library_list
 
 
+def list_libraries_with_counts() -> list[LibraryData]:
+    """List all libraries with live document counts.
+
+    Like :func:`list_libraries`, but ``document_count`` comes from one
+    grouped scan of the documents table rather than the stored column,
+    which lags behind writes until the background refresh has run. The
+    listing costs two queries regardless of the number of libraries.
+
+    Returns:
+        List of all libraries with their metadata and document counts.
+    """
+    counts = _count_documents_by_library()
+    library_list = list_libraries()
+    for lib in library_list:
+        lib["document_count"] = counts.get(lib["id"], 0)
+
+    return library_list
+
+
+def iter_libraries(batch_size: int = 256) -> Iterator[LibraryData]:
+    """Iterate over all libraries with live document counts.
+
+    Yields the same libraries as :func:`list_libraries_with_counts` (the
+    two listing formats share an ETag), but lazily: rows are fetched as one
+    Arrow table and converted to dicts ``batch_size`` rows at a time, so
+    callers can stream them without holding every row as Python objects.
+
+    Args:
+        batch_size: Number of rows converted per Arrow batch.
+
+    Yields:
+        Library data with its document count.
+    """
+    counts = _count_documents_by_library()
+    table = get_libraries_table().search().select(_LIBRARY_FIELDS).to_arrow()
+
+    for batch in table.to_batches(max_chunksize=batch_size):
+        for lib in batch.to_pylist():
+            lib["document_count"] = counts.get(lib["id"], 0)
+            yield lib
+
+
+def get_listing_version() -> tuple[int, int]:
+    """Get the versions of the tables the library listing reads.
+
+    The listing combines library rows with document counts, so it changes
+    whenever either table is written.
+
+    Returns:
+        Tuple of (libraries table version, documents table version).
+    """
+    return get_libraries_table().version, get_documents_table().version
+
+
 def create_library(
     name: str,
     language: str,
@@ -142,7 +219,7 @@ def create_library(
     # 1. Validate name uniqueness within ecosystem
     existing = (
         libraries.search()
-        .where(f"name = '{name}' AND ecosystem = '{ecosystem}'", prefilter=True)
+        .where(_name_filter(name, ecosystem), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -224,28 +301,72 @@ def create_library(
     }
 
 
+def get_library_rows(library_ids: set[str]) -> dict[str, dict]:
+    """Look up libraries-table rows by ID, querying only uncached ones.
+
+    Rows are cached per (id, libraries table version), so any library
+    write invalidates them; uncached IDs are fetched in a single query.
+    The document service uses this for every library it writes under.
+
+    Args:
+        library_ids: IDs to look up.
+
+    Returns:
+        Libraries-table rows keyed by ID; missing IDs are absent. The
+        rows are shared with the cache and must not be modified.
+    """
+    libraries_table = get_libraries_table()
+    version = libraries_table.version
+
+    libraries = {}
+    for library_id in library_ids:
+        library = _row_cache.get((library_id, version))
+        if library is not None:
+            libraries[library_id] = library
+
+    missing = sorted(library_ids - libraries.keys())
+    if missing:
+        id_list = ", ".join(sql_string(library_id) for library_id in missing)
+        for lib in (
+            libraries_table.search()
+            .where(f"id IN ({id_list})", prefilter=True)
+            .limit(len(missing))
+            .to_list()
+        ):
+            _row_cache.set((lib["id"], version), lib)
+            libraries[lib["id"]] = lib
+
+    return libraries
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Get counters for the library row cache.
+
+    Returns:
+        Stats for the library lookup cache.
+    """
+    return {"library_lookup": _row_cache.stats()}
+
+
 def get_library(library_id: str) -> LibraryData:
     """Get library details by ID.
 
     Args:
         library_id: Library unique identifier.
 
+    ``document_count`` is counted live, as in the listings, rather than
+    read from the stored column, which lags behind document writes until
+    the background refresh has run.
+
     Returns:
         Library data.
 
     Raises:
         ValueError: If library not found.
     """
-    libraries = get_libraries_table()
-    results = (
-        libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
-        .limit(1)
-        .to_list()
-    )
-    if not results:
+    lib = get_library_rows({library_id}).get(library_id)
+    if lib is None:
         raise LibraryNotFoundError(library_id)
-    lib = results[0]
     return {
         "id": lib["id"],
         "name": lib["name"],
@@ -265,7 +386,7 @@ def get_library(library_id: str) -> LibraryData:
         "popularity_score": lib["popularity_score"],
         "created_at": lib["created_at"],
         "updated_at": lib["updated_at"],
-        "document_count": lib["document_count"],
+        "document_count": _count_documents(library_id),
     }
 
 
@@ -274,8 +395,6 @@ def update_library(
 ) -> LibraryData:
     """Update library (full update).
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
-
     Args:
         library_id: Library unique identifier.
         name: New library name.
@@ -293,7 +412,7 @@ def update_library(
     # 1. Verify library exists
     existing = (
         libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
+        .where(where_eq("id", library_id), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -306,56 +425,18 @@ def update_library(
     if name != lib["name"]:
         duplicates = (
             libraries.search()
-            .where(
-                f"name = '{name}' AND ecosystem = '{lib['ecosystem']}'",
-                prefilter=True,
-            )
+            .where(_name_filter(name, lib["ecosystem"]), prefilter=True)
             .limit(1)
             .to_list()
         )
         if duplicates:
             raise LibraryExistsError(name, lib["ecosystem"])
 
-    # 3. Delete and re-add with updated fields
-    libraries.delete(f"id = '{library_id}'")
-
-    updated_data = {
-        "id": lib["id"],
-        "name": name,
-        "context7_id": lib["context7_id"],
-        "language": lib["language"],
-        "ecosystem": lib["ecosystem"],
-        "description": description,
-        "short_description": lib["short_description"],
-        "aliases": lib["aliases"],
-        "keywords": lib["keywords"],
-        "category": lib["category"],
-        "homepage_url": lib["homepage_url"],
-        "repository_url": lib["repository_url"],
-        "logo_url": lib.get("logo_url", ""),
-        "author": lib["author"],
-        "license": lib["license"],
-        "status": lib["status"],
-        "popularity_score": lib["popularity_score"],
-        "github_stars": lib.get("github_stars", 0),
-        "npm_downloads_weekly": lib.get("npm_downloads_weekly", 0),
-        "pypi_downloads_monthly": lib.get("pypi_downloads_monthly", 0),
-        "doc_version": lib.get("doc_version", ""),
-        "doc_source_type": lib.get("doc_source_type", ""),
-        "doc_completeness": lib.get("doc_completeness", 0.0),
-        "last_indexed_at": lib.get("last_indexed_at"),
-        "related_libraries": lib.get("related_libraries", []),
-        "alternative_to": lib.get("alternative_to", []),
-        "supersedes": lib.get("supersedes", []),
-        "requires_libraries": lib.get("requires_libraries", []),
-        "first_release_date": lib.get("first_release_date"),
-        "last_release_date": lib.get("last_release_date"),
-        "created_at": lib["created_at"],
-        "updated_at": now,
-        "document_count": lib["document_count"],
-    }
-
-    libraries.add([updated_data])
+    # 3. Update only the changed columns in place
+    libraries.update(
+        where=where_eq("id", library_id),
+        values={"name": name, "description": description, "updated_at": now},
+    )
 
     return {
         "id": lib["id"],
@@ -385,7 +466,6 @@ def partial_update_library(
 ) -> LibraryData:
     """Update library (partial update).
 
-    Uses delete-then-re-add pattern since LanceDB has no UPDATE.
     Only updates fields that are explicitly provided.
 
     Args:
@@ -405,7 +485,7 @@ def partial_update_library(
     # 1. Verify library exists
     existing = (
         libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
+        .where(where_eq("id", library_id), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -422,56 +502,20 @@ def partial_update_library(
     if name is not None and name != lib["name"]:
         duplicates = (
             libraries.search()
-            .where(
-                f"name = '{name}' AND ecosystem = '{lib['ecosystem']}'",
-                prefilter=True,
-            )
+            .where(_name_filter(name, lib["ecosystem"]), prefilter=True)
             .limit(1)
             .to_list()
         )
         if duplicates:
             raise LibraryExistsError(name, lib["ecosystem"])
 
-    # 4. Delete and re-add with updated fields
-    libraries.delete(f"id = '{library_id}'")
-
-    updated_data = {
-        "id": lib["id"],
-        "name": new_name,
-        "context7_id": lib["context7_id"],
-        "language": lib["language"],
-        "ecosystem": lib["ecosystem"],
-        "description": new_description,
-        "short_description": lib["short_description"],
-        "aliases": lib["aliases"],
-        "keywords": lib["keywords"],
-        "category": lib["category"],
-        "homepage_url": lib["homepage_url"],
-        "repository_url": lib["repository_url"],
-        "logo_url": lib.get("logo_url", ""),
-        "author": lib["author"],
-        "license": lib["license"],
-        "status": lib["status"],
-        "popularity_score": lib["popularity_score"],
-        "github_stars": lib.get("github_stars", 0),
-        "npm_downloads_weekly": lib.get("npm_downloads_weekly", 0),
-        "pypi_downloads_monthly": lib.get("pypi_downloads_monthly", 0),
-        "doc_version": lib.get("doc_version", ""),
-        "doc_source_type": lib.get("doc_source_type", ""),
-        "doc_completeness": lib.get("doc_completeness", 0.0),
-        "last_indexed_at": lib.get("last_indexed_at"),
-        "related_libraries": lib.get("related_libraries", []),
-        "alternative_to": lib.get("alternative_to", []),
-        "supersedes": lib.get("supersedes", []),
-        "requires_libraries": lib.get("requires_libraries", []),
-        "first_release_date": lib.get("first_release_date"),
-        "last_release_date": lib.get("last_release_date"),
-        "created_at": lib["created_at"],
-        "updated_at": now,
-        "document_count": lib["document_count"],
-    }
-
-    libraries.add([updated_data])
+    # 4. Update only the provided columns in place
+    values: dict[str, str | datetime] = {"updated_at": now}
+    if name is not None:
+        values["name"] = name
+    if description is not None:
+        values["description"] = description
+    libraries.update(where=where_eq("id", library_id), values=values)
 
     return {
         "id": lib["id"],
@@ -510,14 +554,12 @@ def delete_library(library_id: str) -> bool:
     Raises:
         ValueError: If library not found or has associated documents.
     """
-    from c7_mcp.db import get_documents_table
-
     libraries = get_libraries_table()
 
     # 1. Verify library exists
     existing = (
         libraries.search()
-        .where(f"id = '{library_id}'", prefilter=True)
+        .where(where_eq("id", library_id), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -528,7 +570,7 @@ def delete_library(library_id: str) -> bool:
     documents = get_documents_table()
     doc_results = (
         documents.search()
-        .where(f"library_id = '{library_id}'", prefilter=True)
+        .where(where_eq("library_id", library_id), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -539,6 +581,63 @@ def delete_library(library_id: str) -> bool:
         )
 
     # 3. Delete library
-    libraries.delete(f"id = '{library_id}'")
+    libraries.delete(where_eq("id", library_id))
 
     return True
+
+
+def _count_documents_by_library() -> dict[str, int]:
+    """Count documents per library in a single projected scan.
+
+    Only first chunks (``chunk_index = 0``) are counted, so multi-chunk
+    documents count once.
+
+    Returns:
+        Mapping of library ID to document count (libraries without
+        documents are absent).
+    """
+    documents = get_documents_table()
+    return Counter(
+        row["library_id"]
+        for row in documents.search()
+        .where("chunk_index = 0", prefilter=True)
+        .select(["library_id"])
+        .to_list()
+    )
+
+
+def _count_documents(library_id: str) -> int:
+    """Count one library's documents with a filtered ``count_rows``.
+
+    Args:
+        library_id: Library unique identifier.
+
+    Returns:
+        Number of documents (first chunks) in the library.
+    """
+    return get_documents_table().count_rows(
+        f"{where_eq('library_id', library_id)} AND chunk_index = 0"
+    )
+
+
+def refresh_document_counts(library_ids: Iterable[str]) -> None:
+    """Recount documents for the given libraries.
+
+    Each library is counted with a filtered ``count_rows`` and written
+    back only when its stored count changed, so a refresh that changes
+    nothing leaves the libraries table version (and the caches and ETags
+    keyed on it) untouched. Intended to run as a background task after
+    document writes, with the libraries those writes touched.
+
+    Args:
+        library_ids: Libraries whose document count may have changed.
+            Unknown IDs (e.g. a library deleted meanwhile) are skipped.
+    """
+    libraries = get_libraries_table()
+
+    for library_id, lib in get_library_rows(set(library_ids)).items():
+        count = _count_documents(library_id)
+        if lib["document_count"] != count:
+            libraries.update(
+                where=where_eq("id", library_id), values={"document_count": count}
+            )
@@ -3,9 +3,30 @@
 This module provides business logic for MCP tools following the JSON-RPC 2.0 protocol.
 """
 
-import json
 import os
-import urllib.request
+
+from c7_mcp.cache import CacheStats, TTLCache
+from c7_mcp.db import get_documents_table, get_libraries_table, sql_string, where_eq
+from c7_mcp.http_client import get_http_client
+from c7_mcp.services import document as document_service
+from c7_mcp.services import library as library_service
+
+# Tool results keyed by their arguments plus the versions of the tables they
+# read, so any write to those tables naturally misses the cache.
+_resolve_cache = TTLCache(maxsize=2048, ttl=300.0)
+_query_cache = TTLCache(maxsize=2048, ttl=300.0)
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Get counters for the tool result caches.
+
+    Returns:
+        Stats for the resolve-library-id and query-docs caches.
+    """
+    return {
+        "resolve_library_id": _resolve_cache.stats(),
+        "query_docs": _query_cache.stats(),
+    }
 
 
 def _guess_language(ecosystem: str) -> str:
@@ -51,13 +72,10 @@ def _resolve_remote_context7_library(
         },
     }
 
-    req = urllib.request.Request(
-        mcp_url,
-        data=json.dumps(request_data).encode("utf-8"),
-        headers=headers,
-    )
-    with urllib.request.urlopen(req, timeout=30) as response:
-        result = json.loads(response.read().decode("utf-8"))
+    # Shared pooled client: repeat lookups reuse the TLS connection
+    response = get_http_client().post(mcp_url, json=request_data, headers=headers)
+    response.raise_for_status()
+    result = response.json()
 
     content_text = result["result"]["content"][0]["text"]
 
@@ -100,14 +118,12 @@ def _find_local_library_by_name_or_context7(
     *, library_name: str, context7_id: str | None = None
 ) -> dict | None:
     """Find a local library by name or context7_id."""
-    from c7_mcp.db import get_libraries_table
-
     libraries = get_libraries_table()
 
     if context7_id:
         by_context7 = (
             libraries.search()
-            .where(f"context7_id = '{context7_id}'", prefilter=True)
+            .where(where_eq("context7_id", context7_id), prefilter=True)
             .limit(1)
             .to_list()
         )
@@ -116,7 +132,7 @@ def _find_local_library_by_name_or_context7(
 
     by_name = (
         libraries.search()
-        .where(f"name = '{library_name}'", prefilter=True)
+        .where(where_eq("name", library_name), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -136,14 +152,32 @@ def resolve_library_id(library_name: str, query: str) -> str:
     Returns:
         Formatted list of matching libraries with Context7-compatible IDs.
     """
-    from c7_mcp.db import get_libraries_table
-
     libraries = get_libraries_table()
 
+    # The result depends only on the name and the libraries table contents
+    cache_key = (library_name, libraries.version)
+    result = _resolve_cache.get(cache_key)
+    if result is None:
+        result = _search_libraries(libraries, library_name)
+        _resolve_cache.set(cache_key, result)
+
+    return result
+
+
+def _search_libraries(libraries, library_name: str) -> str:
+    """Search libraries by exact name, then by substring.
+
+    Args:
+        libraries: LanceDB libraries table.
+        library_name: Name of the library to look for.
+
+    Returns:
+        Formatted list of matching libraries, or a not-found message.
+    """
     # 1. Try exact name match
     results = (
         libraries.search()
-        .where(f"name = '{library_name}'", prefilter=True)
+        .where(where_eq("name", library_name), prefilter=True)
         .limit(10)
         .to_list()
     )
@@ -152,7 +186,7 @@ def resolve_library_id(library_name: str, query: str) -> str:
     if not results:
         results = (
             libraries.search()
-            .where(f"name LIKE '%{library_name}%'", prefilter=True)
+            .where(f"name LIKE {sql_string(f'%{library_name}%')}", prefilter=True)
             .limit(10)
             .to_list()
         )
@@ -181,9 +215,6 @@ def fetch_library_docs(
     fetch_if_missing: bool,
 ) -> str:
     """Fetch docs from Context7 only when missing locally and explicitly requested."""
-    from c7_mcp.services import document as document_service
-    from c7_mcp.services import library as library_service
-
     existing = _find_local_library_by_name_or_context7(library_name=library_name)
     if existing:
         return (
@@ -268,15 +299,34 @@ def query_docs(library_id: str, query: str) -> str:
     Returns:
         Documentation content relevant to the query.
     """
-    from c7_mcp.db import get_documents_table, get_libraries_table
-
     libraries = get_libraries_table()
     documents = get_documents_table()
 
+    cache_key = (library_id, query, libraries.version, documents.version)
+    result = _query_cache.get(cache_key)
+    if result is None:
+        result = _search_library_docs(libraries, documents, library_id, query)
+        _query_cache.set(cache_key, result)
+
+    return result
+
+
+def _search_library_docs(libraries, documents, library_id: str, query: str) -> str:
+    """Find a library and return its chunks ranked by query keyword hits.
+
+    Args:
+        libraries: LanceDB libraries table.
+        documents: LanceDB documents table.
+        library_id: Context7-compatible or internal library identifier.
+        query: Documentation query string.
+
+    Returns:
+        Combined documentation text, or a not-found message.
+    """
     # Find library by context7_id (MCP clients use context7 IDs)
     lib_results = (
         libraries.search()
-        .where(f"context7_id = '{library_id}'", prefilter=True)
+        .where(where_eq("context7_id", library_id), prefilter=True)
         .limit(1)
         .to_list()
     )
@@ -285,7 +335,7 @@ def query_docs(library_id: str, query: str) -> str:
     if not lib_results:
         lib_results = (
             libraries.search()
-            .where(f"id = '{library_id}'", prefilter=True)
+            .where(where_eq("id", library_id), prefilter=True)
             .limit(1)
             .to_list()
         )
@@ -296,10 +346,11 @@ def query_docs(library_id: str, query: str) -> str:
     our_lib_id = lib_results[0]["id"]
     lib_name = lib_results[0]["name"]
 
-    # Get all chunks for this library
+    # Get all chunks for this library (text only; the vectors are unused)
     chunks = (
         documents.search()
-        .where(f"library_id = '{our_lib_id}'", prefilter=True)
+        .where(where_eq("library_id", our_lib_id), prefilter=True)
+        .select(["text"])
         .limit(100)
         .to_list()
     )
@@ -0,0 +1,47 @@
+"""Unit tests for the TTL/LRU result cache."""
+
+from c7_mcp import cache as cache_module
+from c7_mcp.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned."""
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set("a", [1, 2])
+        assert cache.get("a") == [1, 2]
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self, monkeypatch):
+        """Test that entries are dropped once their TTL has passed."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=4, ttl=10.0)
+        cache.set("a", 1)
+        now[0] += 9.0
+        assert cache.get("a") == 1
+        now[0] += 2.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_stats_count_hits_and_misses(self):
+        """Test that lookups are counted as hits or misses."""
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        assert cache.stats() == {"size": 1, "maxsize": 4, "hits": 2, "misses": 1}
@@ -0,0 +1,29 @@
+"""Unit tests for LanceDB filter quoting."""
+
+import lancedb
+
+from c7_mcp.db import sql_string, where_eq
+
+
+class TestSqlString:
+    """Tests for sql_string and where_eq."""
+
+    def test_plain_value(self):
+        """Test that a value without quotes is only wrapped."""
+        assert sql_string("doc-1") == "'doc-1'"
+
+    def test_quotes_are_doubled(self):
+        """Test that embedded single quotes are doubled."""
+        assert sql_string("x' OR '1'='1") == "'x'' OR ''1''=''1'"
+
+    def test_where_eq(self):
+        """Test that where_eq quotes the value but not the column."""
+        assert where_eq("id", "O'Brien") == "id = 'O''Brien'"
+
+    def test_injection_matches_nothing(self, tmp_path):
+        """Test that a quote-bearing value is compared literally by LanceDB."""
+        table = lancedb.connect(tmp_path).create_table(
+            "rows", data=[{"id": "a"}, {"id": "b"}, {"id": "O'Brien"}]
+        )
+        assert table.count_rows(where_eq("id", "x' OR '1'='1")) == 0
+        assert table.count_rows(where_eq("id", "O'Brien")) == 1
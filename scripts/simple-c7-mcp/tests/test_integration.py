@@ -10,6 +10,8 @@ Run against a live server:
 """
 
 import argparse
+import json
+import struct
 import sys
 import textwrap
 from collections.abc import Callable
@@ -70,6 +72,8 @@ class Suite:
 
 # A check is (predicate_on_body, description_string)
 Check = tuple[Callable[[dict[str, Any]], bool], str]
+# A response check sees the raw response (headers, raw body)
+ResponseCheck = tuple[Callable[[httpx.Response], bool], str]
 
 
 def call(
@@ -79,6 +83,7 @@ def call(
     expected_status: int,
     *,
     checks: list[Check] | None = None,
+    response_checks: list[ResponseCheck] | None = None,
 ) -> dict[str, Any] | None:
     """Execute one HTTP request and record pass/fail/skip in *suite*.
 
@@ -89,6 +94,8 @@ def call(
         expected_status: Expected HTTP status code.
         checks: Optional list of (predicate, description) pairs evaluated
             against the parsed JSON body.
+        response_checks: Optional list of (predicate, description) pairs
+            evaluated against the raw ``httpx.Response``.
 
     Returns:
         Parsed JSON body dict on success, None otherwise.
@@ -123,16 +130,20 @@ def call(
     except Exception:
         pass
 
-    if checks:
-        for predicate, description in checks:
-            try:
-                ok = predicate(body)
-            except Exception as exc:
-                suite.add(name, Status.FAIL, f"Check raised: {exc}")
-                return body
-            if not ok:
-                suite.add(name, Status.FAIL, f"Check failed: {description}")
-                return body
+    targets: list[tuple[Callable[[Any], bool], str, Any]] = [
+        (predicate, description, body) for predicate, description in checks or []
+    ] + [
+        (predicate, description, r) for predicate, description in response_checks or []
+    ]
+    for predicate, description, target in targets:
+        try:
+            ok = predicate(target)
+        except Exception as exc:
+            suite.add(name, Status.FAIL, f"Check raised: {exc}")
+            return body
+        if not ok:
+            suite.add(name, Status.FAIL, f"Check failed: {description}")
+            return body
 
     suite.add(name, Status.PASS)
     return body
@@ -216,7 +227,7 @@ def run_libraries(client: httpx.Client) -> tuple[Suite, str | None]:
         call(suite, "GET /api/v1/libraries includes created library",
              lambda: client.get("/api/v1/libraries"), 200,
              checks=[(lambda b: _id in [lib.get("id") for lib in (b if isinstance(b, list) else [])],
-                      f"created id in list")])
+                      "created id in list")])
 
     return suite, created_id
 
@@ -260,7 +271,9 @@ def run_documents(client: httpx.Client, library_id: str | None) -> tuple[Suite,
              "title": "Bad Doc",
              "library_id": "nonexistent-lib-xyz",
              "content": "content",
-         }), 404)
+         }), 404,
+         checks=[(lambda b: b.get("error") == "library_not_found",
+                  "error == 'library_not_found'")])
 
     # get metadata
     if created_doc_id:
@@ -276,6 +289,10 @@ def run_documents(client: httpx.Client, library_id: str | None) -> tuple[Suite,
     call(suite, "GET /api/v1/documents/nonexistent → 404",
          lambda: client.get("/api/v1/documents/nonexistent-doc-xyz"), 404)
 
+    # quote in the id is compared literally, not spliced into the filter
+    call(suite, "GET /api/v1/documents/x' OR '1'='1 → 404",
+         lambda: client.get("/api/v1/documents/x' OR '1'='1"), 404)
+
     # get content
     if created_doc_id:
         _doc = created_doc_id
@@ -367,6 +384,335 @@ def run_documents(client: httpx.Client, library_id: str | None) -> tuple[Suite,
     return suite, created_doc_id
 
 
+def run_conditional_get(client: httpx.Client, library_id: str | None) -> Suite:
+    """Test ETag / If-None-Match handling on document reads."""
+    suite = Suite("Conditional GET")
+
+    if not library_id:
+        suite.add("GET /api/v1/documents/{id} If-None-Match", Status.SKIP,
+                  "no library_id available")
+        return suite
+
+    _lib = library_id
+    body = call(suite, "POST /api/v1/documents → 201 (etag fixture)",
+                lambda: client.post("/api/v1/documents", json={
+                    "title": "ETag Doc",
+                    "library_id": _lib,
+                    "content": "Conditional GET fixture.",
+                }), 201)
+    doc_id = body.get("id") if body else None
+    if not doc_id:
+        return suite
+
+    _doc = doc_id
+    etag = client.get(f"/api/v1/documents/{_doc}").headers.get("etag", "")
+    call(suite, "GET /api/v1/documents/{id} matching If-None-Match → 304",
+         lambda: client.get(f"/api/v1/documents/{_doc}",
+                            headers={"If-None-Match": etag}), 304,
+         response_checks=[(lambda r: r.headers.get("etag") == etag, "ETag echoed")])
+
+    # a write to another document leaves this document's tag valid
+    neighbour = client.post("/api/v1/documents", json={
+        "title": "ETag Neighbour", "library_id": _lib, "content": "Unrelated write.",
+    }).json()
+    call(suite, "GET /api/v1/documents/{id} after unrelated write → 304",
+         lambda: client.get(f"/api/v1/documents/{_doc}",
+                            headers={"If-None-Match": etag}), 304)
+
+    client.patch(f"/api/v1/documents/{_doc}/title", json={"title": "ETag Doc v2"})
+    call(suite, "GET /api/v1/documents/{id} stale If-None-Match → 200 + new ETag",
+         lambda: client.get(f"/api/v1/documents/{_doc}",
+                            headers={"If-None-Match": etag}), 200,
+         checks=[(lambda b: b.get("title") == "ETag Doc v2", "title updated")],
+         response_checks=[(lambda r: r.headers.get("etag") not in (None, etag),
+                           "ETag changed")])
+
+    call(suite, "GET /api/v1/documents/nonexistent If-None-Match: * → 404",
+         lambda: client.get("/api/v1/documents/nonexistent-doc-xyz",
+                            headers={"If-None-Match": "*"}), 404)
+
+    client.delete(f"/api/v1/documents/{_doc}")
+    client.delete(f"/api/v1/documents/{neighbour['id']}")
+    return suite
+
+
+def run_bulk_create(client: httpx.Client, library_id: str | None) -> Suite:
+    """Test POST /api/v1/documents/bulk."""
+    suite = Suite("Bulk Create")
+
+    if not library_id:
+        suite.add("POST /api/v1/documents/bulk", Status.SKIP, "no library_id available")
+        return suite
+
+    _lib = library_id
+    titles = [f"Bulk Doc {i}" for i in range(3)]
+    created = call(suite, "POST /api/v1/documents/bulk → 201 in request order",
+                   lambda: client.post("/api/v1/documents/bulk", json=[
+                       {"title": title, "library_id": _lib,
+                        "content": f"Body of {title}"}
+                       for title in titles
+                   ]), 201,
+                   checks=[(lambda b: [d.get("title") for d in b] == titles,
+                            "titles in request order")])
+
+    # the single-library read counts live, like the listing
+    listed = {lib["id"]: lib["document_count"]
+              for lib in client.get("/api/v1/libraries").json()}
+    call(suite, "GET /api/v1/libraries/{id} document_count matches listing",
+         lambda: client.get(f"/api/v1/libraries/{_lib}"), 200,
+         checks=[(lambda b: b.get("document_count") == listed.get(_lib),
+                  "same count as GET /api/v1/libraries")])
+
+    def titles_in_library() -> list[str]:
+        listing = client.get("/api/v1/documents", params={"library_id": _lib}).json()
+        return [d.get("title") for d in listing]
+
+    rejected = "Bulk Rejected Doc"
+    call(suite, "POST /api/v1/documents/bulk one missing library → 404",
+         lambda: client.post("/api/v1/documents/bulk", json=[
+             {"title": rejected, "library_id": _lib, "content": "kept out"},
+             {"title": rejected, "library_id": "nonexistent-lib-xyz", "content": "x"},
+         ]), 404,
+         response_checks=[(lambda r: rejected not in titles_in_library(),
+                           "nothing written")])
+
+    call(suite, "POST /api/v1/documents/bulk reports every missing library",
+         lambda: client.post("/api/v1/documents/bulk", json=[
+             {"title": rejected, "library_id": "nonexistent-lib-a", "content": "x"},
+             {"title": rejected, "library_id": "nonexistent-lib-b", "content": "x"},
+         ]), 404,
+         response_checks=[(lambda r: "nonexistent-lib-a" in r.text
+                           and "nonexistent-lib-b" in r.text, "both ids reported")])
+
+    for doc in created or []:
+        client.delete(f"/api/v1/documents/{doc['id']}")
+    return suite
+
+
+def run_fetch_bulk(client: httpx.Client, library_id: str | None) -> Suite:
+    """Test POST /api/v1/documents/fetch/bulk.
+
+    The reachable URL is the server's own /health endpoint, so no outbound
+    network access is needed.
+    """
+    suite = Suite("Bulk Fetch from URL")
+
+    if not library_id:
+        suite.add("POST /api/v1/documents/fetch/bulk", Status.SKIP,
+                  "no library_id available")
+        return suite
+
+    _lib = library_id
+    reachable = f"{str(client.base_url).rstrip('/')}/health"
+    unreachable = "http://127.0.0.1:9/"
+    results = call(suite, "POST /api/v1/documents/fetch/bulk → 200 per-item results",
+                   lambda: client.post("/api/v1/documents/fetch/bulk", json=[
+                       {"title": "Health", "library_id": _lib, "url": reachable},
+                       {"title": "No Lib", "library_id": "nonexistent-lib-xyz",
+                        "url": reachable},
+                       {"title": "Down", "library_id": _lib, "url": unreachable},
+                   ], timeout=30.0), 200,
+                   checks=[
+                       (lambda b: [r.get("url") for r in b]
+                        == [reachable, reachable, unreachable],
+                        "one result per item, in order"),
+                       (lambda b: b[0]["error"] is None
+                        and b[0]["document"]["library_id"] == _lib,
+                        "reachable URL created"),
+                       (lambda b: b[1]["document"] is None
+                        and "nonexistent-lib-xyz" in b[1]["error"],
+                        "missing library reported"),
+                       (lambda b: b[2]["document"] is None
+                        and b[2]["error"].startswith("Failed to fetch URL"),
+                        "unreachable URL reported"),
+                   ])
+
+    for result in results or []:
+        if result.get("document"):
+            client.delete(f"/api/v1/documents/{result['document']['id']}")
+    return suite
+
+
+def run_binary_embeddings(client: httpx.Client, library_id: str | None) -> Suite:
+    """Test PATCH/GET /api/v1/documents/{id}/embeddings:bin round trip."""
+    suite = Suite("Binary Embeddings")
+
+    if not library_id:
+        suite.add("PATCH /api/v1/documents/{id}/embeddings:bin", Status.SKIP,
+                  "no library_id available")
+        return suite
+
+    _lib = library_id
+    body = call(suite, "POST /api/v1/documents → 201 (embeddings fixture)",
+                lambda: client.post("/api/v1/documents", json={
+                    "title": "Binary Embeddings Doc",
+                    "library_id": _lib,
+                    "content": "Binary embeddings fixture.",
+                }), 201)
+    doc_id = body.get("id") if body else None
+    if not doc_id:
+        return suite
+
+    _doc = doc_id
+    dim = 2560
+    values = [((i % 17) - 8) / 8 for i in range(dim)]
+    payload = struct.pack(f"<{dim}f", *values)
+    url = f"/api/v1/documents/{_doc}/embeddings:bin"
+    octet = {"Content-Type": "application/octet-stream"}
+
+    call(suite, "PATCH …/embeddings:bin → 200",
+         lambda: client.patch(url, content=payload,
+                              headers={**octet, "X-Dim": str(dim)},
+                              params={"model": "test-model"}), 200,
+         checks=[(lambda b: b.get("has_embeddings") is True, "has_embeddings=True")])
+
+    call(suite, "GET …/embeddings:bin float32 → same bytes",
+         lambda: client.get(url), 200,
+         response_checks=[
+             (lambda r: r.content == payload, "body round-trips exactly"),
+             (lambda r: r.headers.get("x-dim") == str(dim), "X-Dim header"),
+             (lambda r: r.headers.get("x-embedding-model") == "test-model",
+              "X-Embedding-Model header"),
+         ])
+
+    def dequantized(r: httpx.Response) -> list[float]:
+        scale = float(r.headers["x-scale"])
+        zero_point = int(r.headers["x-zero-point"])
+        return [(q - zero_point) * scale for q in struct.unpack(f"<{dim}b", r.content)]
+
+    call(suite, "GET …/embeddings:bin?dtype=int8 → quantized",
+         lambda: client.get(url, params={"dtype": "int8"}), 200,
+         response_checks=[
+             (lambda r: len(r.content) == dim, "one byte per value"),
+             (lambda r: max(abs(a - b) for a, b in
+                            zip(dequantized(r), values, strict=True)) < 0.01,
+              "dequantizes close to the original"),
+         ])
+
+    call(suite, "PATCH …/embeddings:bin X-Dim mismatch → 400",
+         lambda: client.patch(url, content=payload,
+                              headers={**octet, "X-Dim": str(dim - 1)}), 400)
+
+    call(suite, "PATCH …/embeddings:bin body size mismatch → 400",
+         lambda: client.patch(url, content=payload + b"\0\0\0\0",
+                              headers={**octet, "X-Dim": str(dim)}), 400)
+
+    client.delete(f"/api/v1/documents/{_doc}")
+    return suite
+
+
+def run_pagination(client: httpx.Client, library_id: str | None) -> Suite:
+    """Test limit/offset paging of GET /api/v1/documents."""
+    suite = Suite("Pagination")
+
+    if not library_id:
+        suite.add("GET /api/v1/documents?limit=…&offset=…", Status.SKIP,
+                  "no library_id available")
+        return suite
+
+    # Use a dedicated library so other suites' documents do not shift pages
+    lib_body = call(suite, "POST /api/v1/libraries → 201 (pagination fixture)",
+                    lambda: client.post("/api/v1/libraries", json={
+                        "name": f"{TEST_LIBRARY_NAME}-pages",
+                        "language": "Python",
+                        "ecosystem": "pypi",
+                    }), 201)
+    page_lib = lib_body.get("id") if lib_body else None
+    if not page_lib:
+        return suite
+
+    _lib = page_lib
+    created = client.post("/api/v1/documents/bulk", json=[
+        {"title": f"Page Doc {i}", "library_id": _lib, "content": f"Page body {i}"}
+        for i in range(5)
+    ]).json()
+    created_ids = {doc["id"] for doc in created}
+
+    pages: list[list[str]] = []
+    for offset in (0, 2, 4):
+        _offset = offset
+        body = call(suite,
+                    f"GET /api/v1/documents?limit=2&offset={offset} → non-empty page",
+                    lambda: client.get("/api/v1/documents", params={
+                        "library_id": _lib, "limit": 2, "offset": _offset,
+                    }), 200,
+                    checks=[(lambda b: 0 < len(b) <= 2, "1-2 documents")])
+        pages.append([d.get("id") for d in body] if isinstance(body, list) else [])
+
+    flat = [doc_id for page in pages for doc_id in page]
+    if len(flat) == len(set(flat)) and set(flat) == created_ids:
+        suite.add("offset pages are distinct and cover every document", Status.PASS)
+    else:
+        suite.add("offset pages are distinct and cover every document", Status.FAIL,
+                  f"pages={pages}")
+
+    for doc_id in created_ids:
+        client.delete(f"/api/v1/documents/{doc_id}")
+    client.delete(f"/api/v1/libraries/{_lib}")
+    return suite
+
+
+def run_quoted_names(client: httpx.Client) -> Suite:
+    """Test libraries whose names contain a single quote."""
+    suite = Suite("Quoted Library Names")
+
+    suffix = uuid4().hex[:8]
+    name, renamed = f"O'Brien-{suffix}", f"O'Neil-{suffix}"
+    payload = {"name": name, "language": "Python", "ecosystem": "pypi"}
+    body = call(suite, "POST /api/v1/libraries O'Brien → 201",
+                lambda: client.post("/api/v1/libraries", json=payload), 201,
+                checks=[(lambda b: b.get("name") == name, "name stored verbatim")])
+    library_id = body.get("id") if body else None
+    if not library_id:
+        return suite
+
+    _lib = library_id
+    call(suite, "POST /api/v1/libraries O'Brien again → 409",
+         lambda: client.post("/api/v1/libraries", json=payload), 409)
+
+    call(suite, "PATCH /api/v1/libraries/{id} rename to O'Neil → 200",
+         lambda: client.patch(f"/api/v1/libraries/{_lib}", json={"name": renamed}), 200,
+         checks=[(lambda b: b.get("name") == renamed, "name updated")])
+
+    call(suite, "GET /api/v1/libraries/{id} → renamed",
+         lambda: client.get(f"/api/v1/libraries/{_lib}"), 200,
+         checks=[(lambda b: b.get("name") == renamed, "renamed name returned")])
+
+    call(suite, "POST /api/v1/libraries O'Neil → 409",
+         lambda: client.post("/api/v1/libraries",
+                             json={**payload, "name": renamed}), 409)
+
+    client.delete(f"/api/v1/libraries/{_lib}")
+    return suite
+
+
+def run_ndjson_listing(client: httpx.Client) -> Suite:
+    """Test GET /api/v1/libraries with Accept: application/x-ndjson."""
+    suite = Suite("NDJSON Library Listing")
+
+    array = client.get("/api/v1/libraries")
+    array_ids = [lib.get("id") for lib in array.json()]
+
+    def parsed(r: httpx.Response) -> list[dict[str, Any]]:
+        return [json.loads(line) for line in r.text.splitlines()]
+
+    call(suite, "GET /api/v1/libraries Accept: application/x-ndjson → 200",
+         lambda: client.get("/api/v1/libraries",
+                            headers={"Accept": "application/x-ndjson"}), 200,
+         response_checks=[
+             (lambda r: r.headers.get("content-type", "").startswith(
+                 "application/x-ndjson"), "NDJSON content type"),
+             (lambda r: all(isinstance(obj, dict) for obj in parsed(r)),
+              "one JSON object per line"),
+             (lambda r: [obj.get("id") for obj in parsed(r)] == array_ids,
+              "same libraries as the array form"),
+             (lambda r: r.headers.get("etag") == array.headers.get("etag"),
+              "same ETag as the array form"),
+         ])
+
+    return suite
+
+
 def run_document_fetch(
     client: httpx.Client,
     library_id: str | None,
@@ -528,10 +874,18 @@ def run_suites(client: httpx.Client, *, include_fetch: bool = False) -> list[Sui
 
     lib_suite, library_id = run_libraries(client)
     all_suites.append(lib_suite)
+    all_suites.append(run_ndjson_listing(client))
 
     doc_suite, doc_id = run_documents(client, library_id)
     all_suites.append(doc_suite)
 
+    all_suites.append(run_conditional_get(client, library_id))
+    all_suites.append(run_bulk_create(client, library_id))
+    all_suites.append(run_fetch_bulk(client, library_id))
+    all_suites.append(run_binary_embeddings(client, library_id))
+    all_suites.append(run_pagination(client, library_id))
+    all_suites.append(run_quoted_names(client))
+
     all_suites.append(run_document_fetch(client, library_id, run=include_fetch))
     all_suites.append(run_mcp(client, library_id))
     all_suites.append(run_cleanup(client, doc_id, library_id))
@@ -560,7 +914,7 @@ def run_all(base_url: str, *, include_fetch: bool = False) -> int:
     """Run all suites. Returns 0 on success (all pass or skip), 1 on failures, 2 on connection error."""
     use_color = sys.stdout.isatty()
 
-    print(f"\nContext7 MCP Integration Tests")
+    print("\nContext7 MCP Integration Tests")
     print(f"Target: {base_url}")
     print("=" * 64)
 
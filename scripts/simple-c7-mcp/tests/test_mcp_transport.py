@@ -518,6 +518,51 @@ class TestFullHandshake:
         assert "result" in call_messages[0]
 
 
+class TestFetchLibraryDocsBulk:
+    """The fetch-library-docs-bulk tool reports one result per item."""
+
+    def test_missing_library_item_reports_error(self, client: httpx.Client) -> None:
+        """An item whose library does not exist fails on its own."""
+        session_id = extract_session_id(send_initialize(client))
+        assert session_id is not None, "No Mcp-Session-Id after initialize"
+        headers = {
+            "Accept": MCP_ACCEPT,
+            "Content-Type": MCP_CONTENT_TYPE,
+            "Mcp-Session-Id": session_id,
+        }
+        client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            headers=headers,
+        )
+
+        url = "http://127.0.0.1:9/"
+        r = client.post(
+            "/mcp",
+            json=jsonrpc(
+                "tools/call",
+                {
+                    "name": "fetch-library-docs-bulk",
+                    "arguments": {
+                        "documents": [
+                            {"title": "Missing", "library_id": "nonexistent-lib-xyz",
+                             "url": url},
+                        ],
+                    },
+                },
+                req_id=2,
+            ),
+            headers=headers,
+        )
+        assert r.status_code == 200
+        result = parse_sse_jsonrpc(r.text)[0]["result"]
+        assert result["isError"] is False
+        (item,) = result["structuredContent"]["result"]
+        assert item["url"] == url
+        assert item["document"] is None
+        assert "nonexistent-lib-xyz" in item["error"]
+
+
 # ---------------------------------------------------------------------------
 # 8. Error cases
 # ---------------------------------------------------------------------------
@@ -0,0 +1,36 @@
+"""Unit tests for in-process request metrics."""
+
+import pytest
+
+from c7_mcp.metrics import Histogram, RequestMetrics
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observations_land_in_buckets(self):
+        """Test that values are counted in the first bucket that holds them."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        assert histogram.cumulative() == [2, 3, 4]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(3.65)
+
+
+class TestRequestMetrics:
+    """Tests for RequestMetrics."""
+
+    def test_render_prometheus_text(self):
+        """Test the exposition output for one labelled request."""
+        metrics = RequestMetrics("mcp", buckets=(0.1,))
+        metrics.observe("tools/call", 200, 0.05)
+        assert metrics.render().splitlines() == [
+            "# TYPE mcp_requests_total counter",
+            'mcp_requests_total{method="tools/call",status="200"} 1',
+            "# TYPE mcp_request_duration_seconds histogram",
+            'mcp_request_duration_seconds_bucket{method="tools/call",le="0.1"} 1',
+            'mcp_request_duration_seconds_bucket{method="tools/call",le="+Inf"} 1',
+            'mcp_request_duration_seconds_sum{method="tools/call"} 0.05',
+            'mcp_request_duration_seconds_count{method="tools/call"} 1',
+        ]
@@ -0,0 +1,28 @@
+"""Unit tests for int8 embedding quantization."""
+
+import numpy as np
+
+from c7_mcp.quantize import dequantize_int8, quantize_int8
+
+
+class TestQuantizeInt8:
+    """Tests for quantize_int8 and dequantize_int8."""
+
+    def test_round_trip_within_half_a_step(self):
+        """Test that dequantized values are within half a step of the input."""
+        vector = np.random.default_rng(0).normal(size=2560).astype(np.float32)
+        quantized, scale, zero_point = quantize_int8(vector)
+        assert quantized.dtype == np.int8
+        restored = dequantize_int8(quantized, scale, zero_point)
+        assert np.max(np.abs(restored - vector)) <= scale / 2 + 1e-6
+
+    def test_zero_maps_exactly(self):
+        """Test that 0.0 survives quantization unchanged."""
+        quantized, scale, zero_point = quantize_int8(np.array([0.0, 0.3, 2.0]))
+        assert dequantize_int8(quantized, scale, zero_point)[0] == 0.0
+
+    def test_constant_vector(self):
+        """Test that a vector with no range does not divide by zero."""
+        quantized, scale, zero_point = quantize_int8(np.zeros(4))
+        assert scale > 0
+        assert dequantize_int8(quantized, scale, zero_point).tolist() == [0.0] * 4
@@ -0,0 +1,98 @@
+"""Unit tests for the token-bucket rate limiter."""
+
+import asyncio
+
+from c7_mcp import ratelimit as ratelimit_module
+from c7_mcp.api import _McpRateLimitMiddleware
+from c7_mcp.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_allows_burst_then_throttles(self, monkeypatch):
+        """Test that a key gets its burst and then a wait time."""
+        monkeypatch.setattr(ratelimit_module.time, "monotonic", lambda: 100.0)
+        limiter = RateLimiter(rate=2.0, burst=3.0)
+        assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("a") == 0.5
+
+    def test_refills_over_time(self, monkeypatch):
+        """Test that tokens come back at the configured rate."""
+        now = [100.0]
+        monkeypatch.setattr(ratelimit_module.time, "monotonic", lambda: now[0])
+        limiter = RateLimiter(rate=1.0, burst=1.0)
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0.0
+        now[0] += 1.0
+        assert limiter.acquire("a") == 0.0
+
+    def test_keys_have_separate_budgets(self):
+        """Test that one client's usage does not throttle another."""
+        limiter = RateLimiter(rate=1.0, burst=1.0)
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0.0
+        assert limiter.acquire("b") == 0.0
+
+
+class TestMcpRateLimitMiddleware:
+    """Tests for how the MCP rate limiter picks a client's bucket."""
+
+    @staticmethod
+    def _request(middleware, headers=(), client=("10.0.0.1", 5000)) -> list[int]:
+        """Send one POST /mcp through the middleware and return statuses."""
+        scope = {
+            "type": "http",
+            "path": "/mcp",
+            "method": "POST",
+            "headers": list(headers),
+            "client": client,
+        }
+        statuses = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        asyncio.run(middleware(scope, receive, send))
+        return statuses
+
+    @staticmethod
+    def _app(session_id: bytes | None = None):
+        """Build an ASGI app that answers 200, optionally issuing a session."""
+
+        async def app(scope, receive, send):
+            headers = [(b"mcp-session-id", session_id)] if session_id else []
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+
+        return app
+
+    def test_made_up_session_ids_share_the_address_budget(self):
+        """Test that unissued session ids do not get a fresh burst."""
+        middleware = _McpRateLimitMiddleware(self._app(), rate=0.001, burst=1)
+        assert self._request(middleware, [(b"mcp-session-id", b"a")]) == [200]
+        assert self._request(middleware, [(b"mcp-session-id", b"b")]) == [429]
+
+    def test_issued_session_gets_its_own_budget(self):
+        """Test that a session id from our own response is keyed separately."""
+        middleware = _McpRateLimitMiddleware(self._app(b"s1"), rate=0.001, burst=1)
+        assert self._request(middleware) == [200]
+        assert self._request(middleware, [(b"mcp-session-id", b"s1")]) == [200]
+        assert self._request(middleware) == [429]
+
+    def test_trusted_header_separates_clients_behind_a_proxy(self):
+        """Test that the configured header's last address is the key."""
+        middleware = _McpRateLimitMiddleware(
+            self._app(), rate=0.001, burst=1, client_ip_header="X-Forwarded-For"
+        )
+        first = [(b"x-forwarded-for", b"spoofed, 192.0.2.1")]
+        second = [(b"x-forwarded-for", b"192.0.2.2")]
+        assert self._request(middleware, first) == [200]
+        assert self._request(middleware, second) == [200]
+        assert self._request(middleware, first) == [429]